@@ -30,4 +30,10 @@ setuptools.setup(
         'Tracker': 'https://github.com/Guptacos/spotifython/issues',
     },
     install_requires=['requests'],
+    extras_require={
+        # Faster json parsing and serialization
+        'orjson': ['orjson'],
+        # Audio features as numpy arrays
+        'numpy': ['numpy'],
+    },
 )
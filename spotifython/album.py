@@ -1,7 +1,6 @@
 """ Album class. """
 
 # Standard library imports
-import copy
 import sys
 
 # Local imports
@@ -27,6 +26,15 @@ class Album:
         ``__getitem___()``, and ``tracks()`` are not relinked.
     """
 
+    __slots__ = (
+        '_id',
+        '_raw',
+        '_session',
+        '_tracks',
+        '_artists',
+        '__weakref__',
+    )
+
 
     def __init__(self, session, info):
         """ Get an instance of Album. Client should not use the constructor!
@@ -41,11 +49,15 @@ class Album:
 
         # TODO: need to make sure name is here.
 
-        # Defensively copy
-        info = copy.deepcopy(info)
+        # Copied since _update_fields modifies _raw in place. Only the top
+        # level of _raw is ever modified, so a shallow copy is enough.
+        info = dict(info)
 
-        self._id = info['id']
+        # The same id is often built into many objects, so they share one
+        # string
+        self._id = sys.intern(info['id'])
         self._raw = info
+        utils.intern_markets(self._raw)
         self._session = session
 
         # If tracks / paging objects malformed, defer manual track fetching.
@@ -142,12 +154,8 @@ class Album:
         if status_code != 200:
             raise utils.SpotifyError(status_code, response_json)
 
-        # Updates _raw with new values. One liner : for each key in union of
-        # keys in self._raw and response_json, takes value for key from
-        # response_json if present, else takes value for key from self._raw.
-        # TODO: this is weird notation, make a utility function for it.
-        # Especially useful since it is an action necessary for many classes.
-        self._raw = {**self._raw, **response_json}
+        # Updates _raw in place with the new values
+        self._raw.update(response_json)
 
 
     def _update_tracks(self):
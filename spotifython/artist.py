@@ -8,6 +8,9 @@ import spotifython.utils as utils
 # pylint: disable = pointless-string-statement, too-many-instance-attributes
 # pylint: disable = too-many-branches
 
+# Fields only present in Spotify's full artist object, not the simplified one
+_FULL_FIELDS = ('followers', 'genres', 'images', 'popularity')
+
 class Artist:
     """ Represents an Artist object, tied to a Spotify artist id.
 
@@ -27,6 +30,19 @@ class Artist:
           needs no scopes.
     """
 
+    __slots__ = (
+        '_session',
+        '_raw',
+        '_is_full',
+        '_albums',
+        '_top_tracks',
+        '_related_artists',
+        '_albums_query_params',
+        '_top_tracks_query_params',
+        '_related_artists_query_params',
+        '__weakref__',
+    )
+
     def __init__(self, session, info):
         """ Get an instance of Artist. Client should not use the constructor!
 
@@ -44,7 +60,11 @@ class Artist:
         # TODO: need to make sure user is here.
 
         self._session = session
-        self._raw = info
+        # Copied since _update_fields modifies _raw in place
+        self._raw = dict(info)
+        # Whether _raw holds the full artist object from Spotify. If so,
+        # _update_fields never needs to make a request.
+        self._is_full = all(field in info for field in _FULL_FIELDS)
         # Lazily loaded fields from API calls
         self._albums = None
         self._top_tracks = None
@@ -154,12 +174,18 @@ class Artist:
     def _update_fields(self):
         """ If field is not present, update it using the object's artist id.
 
+        Does nothing if the full artist object has already been fetched, since
+        fetching it again can't add any fields.
+
         Raises:
             ValueError if artist id not present in the raw object data.
 
         Calls endpoints:
             - GET     /v1/artists/{id}
         """
+        if self._is_full:
+            return
+
         endpoint = Endpoints.ARTIST_DATA % self.spotify_id()
         response_json, status_code = utils.request(
             session=self._session,
@@ -170,12 +196,9 @@ class Artist:
         if status_code != 200:
             raise utils.SpotifyError(status_code, response_json)
 
-        # Updates _raw with new values. One liner : for each key in union of
-        # keys in self._raw and response_json, takes value for key from
-        # response_json if present, else takes value for key from self._raw.
-        # TODO: this is weird notation, make a utility function for it.
-        # Especially useful since it is an action necessary for many classes.
-        self._raw = {**self._raw, **response_json}
+        # Updates _raw in place with the new values
+        self._raw.update(response_json)
+        self._is_full = True
 
     ##################################
     # API Calls
@@ -219,8 +242,9 @@ class Artist:
             (isinstance(search_limit, int) and search_limit < 1):
             raise TypeError('search_limit should be None or an int > 0')
         if include_groups is not None and \
-            not all(isinstance(x, str) for x in include_groups):
-            raise TypeError('include_groups should be None or str')
+            not (isinstance(include_groups, list) and
+                 all(isinstance(x, str) for x in include_groups)):
+            raise TypeError('include_groups should be None or a list of str')
         if market is not None and not isinstance(market, str):
             raise TypeError('market should be None or str')
 
@@ -370,6 +394,29 @@ class Artist:
 
         return self._related_artists
 
+    def prefetch(self, market=const.TOKEN_REGION):
+        """ Load the artist's top tracks and related artists at the same time.
+
+        The two requests are independent, so they are made concurrently when
+        the session allows it (see the max_workers argument of
+        :class:`Session <spotifython.session.Session>`). Later calls to
+        :meth:`top_tracks` with the same market and :meth:`related_artists`
+        with the default arguments return the loaded results without making
+        another request.
+
+        Args:
+            market (str): a :term:`market code <Market>` or sp.TOKEN_REGION,
+                passed to :meth:`top_tracks`.
+
+        Calls endpoints:
+            - GET	/v1/artists/{id}/top-tracks
+            - GET	/v1/artists/{id}/related-artists
+        """
+        utils.concurrent_map(self._session,
+                             lambda load: load(),
+                             [lambda: self.top_tracks(market=market),
+                              self.related_artists])
+
 #pylint: disable=wrong-import-position
 #pylint: disable=wrong-import-order
 from spotifython.track import Track
@@ -36,7 +36,28 @@ COMPOSITION = 'composition'
 
 # Constants
 DEFAULT_REQUEST_TIMEOUT = 10 # in seconds
+DEFAULT_MAX_WORKERS = 1 # concurrent requests per call
+DEFAULT_CACHE_SIZE = 256 # cached GET responses per session
 SPOTIFY_PAGE_SIZE = 50
+SPOTIFY_PLAYLIST_PAGE_SIZE = 100
+SPOTIFY_AUDIO_FEATURES_PAGE_SIZE = 100
+# Column order of Session.audio_features_array
+AUDIO_FEATURE_KEYS = (
+    'danceability',
+    'energy',
+    'key',
+    'loudness',
+    'mode',
+    'speechiness',
+    'acousticness',
+    'instrumentalness',
+    'liveness',
+    'valence',
+    'tempo',
+    'duration_ms',
+    'time_signature',
+)
+MAX_IMAGE_SIZE = 256 * 1024 # bytes of base64 encoded image per upload
 #pylint: disable=line-too-long
 # See https://developer.spotify.com/documentation/web-api/reference/playlists/get-list-users-playlists/
 MAX_PLAYLISTS = 100000
@@ -15,6 +15,7 @@ class Endpoints:
     SEARCH_USER = 'users/%s'
     SEARCH_CURRENT_USER = 'me'
     SEARCH_PLAYLIST = 'playlists/%s'
+    SEARCH_AUDIO_FEATURES = 'audio-features'
 
     # Artist
     ARTIST_DATA = 'artists/%s'
@@ -25,7 +26,7 @@ class Endpoints:
     # Playlist
     PLAYLIST = 'playlists/%s'
     PLAYLIST_TRACKS = PLAYLIST + '/tracks'
-    PLAYLIST_IMAGES = '/images'
+    PLAYLIST_IMAGES = PLAYLIST + '/images'
 
     # User
     USER_DATA = 'users/%s'
@@ -1,8 +1,5 @@
 """ Image class. """
 
-# Standard library imports
-import copy
-
 class Image:
     """ Container class representing a Spotify image
 
@@ -22,7 +19,8 @@ class Image:
         if 'url' not in info:
             raise ValueError('Image class init with no url')
 
-        self._raw = copy.deepcopy(info)
+        # Image never modifies _raw, so a shallow copy is enough
+        self._raw = dict(info)
 
 
     def __str__(self):
@@ -58,6 +58,8 @@ class Player:
         handled correctly by the player.
     """
 
+    __slots__ = ('_session', '_user')
+
 
     def __init__(self, session, user):
         """ Get an instance of Player. Client should not use the constructor!
@@ -5,6 +5,7 @@ from copy import deepcopy
 import base64
 import sys
 import mimetypes
+import os
 
 # local imports
 from spotifython.endpoints import Endpoints
@@ -32,6 +33,17 @@ class Playlist:
         To ensure a Playlist's data is up to date, use Playlist.refresh().
     """
 
+    __slots__ = (
+        '_raw',
+        '_session',
+        '_owner',
+        '_tracks',
+        '_endpoint',
+        '_tracks_endpoint',
+        '_images_endpoint',
+    )
+
+
     # TODO store only static fields
     def __init__(self, session, info):
         """ Get an instance of Playlist. Client should not use the constructor!
@@ -42,19 +54,23 @@ class Playlist:
             info (dict): the playlist's information. Must contain 'owner' and
                 'id'.
         """
-        self._raw = deepcopy(info)
+        # Copied since info may be a response held by the Session's cache. Only
+        # the top level of _raw is ever replaced, so a shallow copy is enough.
+        self._raw = dict(info)
         self._session = session
         if 'owner' not in info:
             raise ValueError('Playlist owner information missing')
         if 'id' not in info:
             raise ValueError('Playlist id missing')
+
+        # Every request made by the playlist uses one of these endpoints, so
+        # format them once here rather than on each call.
+        playlist_id = info['id']
+        self._endpoint = Endpoints.PLAYLIST % playlist_id
+        self._tracks_endpoint = Endpoints.PLAYLIST_TRACKS % playlist_id
+        self._images_endpoint = Endpoints.PLAYLIST_IMAGES % playlist_id
         self._owner = User(session, info['owner'])
-        self._tracks = []
-        tracks = info.get('tracks', {})
-        for item in tracks.get('items', []):
-            if 'track' not in item:
-                raise ValueError('Track information missing')
-            self._tracks.append(Track(session, item.get('track', {})))
+        self._tracks = self._build_tracks(info)
 
 
     def __str__(self):
@@ -129,7 +145,7 @@ class Playlist:
         Calls:
             GET /v1/playlists/{playlist_id}
         """
-        endpoint = Endpoints.SEARCH_PLAYLIST % self.spotify_id()
+        endpoint = self._endpoint
         response_json, status_code = utils.request(
             self._session,
             request_type='GET',
@@ -138,14 +154,27 @@ class Playlist:
         if status_code != 200:
             raise utils.SpotifyError(status_code, response_json)
 
-        self._raw = response_json
+        self._raw = dict(response_json)
         self._owner = User(self._session, response_json['owner'])
-        self._tracks = []
-        tracks = response_json.get('tracks', {})
-        for item in tracks.get('items', []):
-            if 'track' not in item:
-                raise ValueError('Track information missing')
-            self._tracks.append(Track(self._session, item.get('track', {})))
+        self._tracks = self._build_tracks(response_json)
+
+
+    def _build_tracks(self, info):
+        """ Build the Tracks for the playlist track items in info.
+
+        Args:
+            info (dict): the playlist's information.
+
+        Returns:
+            List[Track]: the tracks in the playlist, in order. Items without a
+            track, such as removed or unavailable tracks, are skipped.
+        """
+        items = info.get('tracks', {}).get('items', [])
+        if any('track' not in item for item in items):
+            raise ValueError('Track information missing')
+
+        return [Track(self._session, item['track']) for item in items
+                if item['track'] is not None]
 
 
     def raw(self):
@@ -207,9 +236,8 @@ class Playlist:
             position: An integer specifying the 0-indexed position in the
                 playlist to insert tracks. A negative integer will be evaluated
                 from the end of the playlist as negative indices behave in
-                lists. This must be a valid index into a list of length
-                len(playlist). Position can be omitted to append to the
-                playlist instead.
+                lists. This must be between 0 and len(playlist), inclusive.
+                Position can be omitted to append to the playlist instead.
 
         Required token scopes:
             - playlist-modify-public: If the playlist is public.
@@ -219,8 +247,7 @@ class Playlist:
         Calls endpoints:
             - POST /v1/playlists/{playlist_id}/tracks
         """
-        endpoint = Endpoints.PLAYLIST_TRACKS % self.spotify_id()
-        body = {}
+        endpoint = self._tracks_endpoint
         uris = []
         if isinstance(tracks, list):
             for track in tracks:
@@ -233,24 +260,36 @@ class Playlist:
                 raise TypeError('The type of tracks must either be a Track ' +
                                 'object or a list of Track objects')
             uris.append(tracks.uri())
-        body['uris'] = uris
-        if position:
+        if position is not None:
             if not isinstance(position, int):
                 raise TypeError('The position must be an integer')
             original_position = position
             if position < 0:
                 position += len(self)
-            if position < 0 or position >= len(self):
+            # Inserting at len(playlist) appends, as it does for lists
+            if position < 0 or position > len(self):
                 raise ValueError(f'Invalid position: {original_position}')
-            body['position'] = position
-        response_json, status_code = utils.request(
-            self._session,
-            request_type='POST',
-            endpoint=endpoint,
-            body=body
+
+        # Spotify accepts at most 100 uris per request. Batches are sent in
+        # order, since each one is inserted after the batch before it.
+        batches = utils.create_batches(
+            uris,
+            batch_size=const.SPOTIFY_PLAYLIST_PAGE_SIZE
         )
-        if status_code != 201:
-            raise utils.SpotifyError(status_code, response_json)
+        for batch in batches:
+            body = {}
+            body['uris'] = batch
+            if position is not None:
+                body['position'] = position
+                position += len(batch)
+            response_json, status_code = utils.request(
+                self._session,
+                request_type='POST',
+                endpoint=endpoint,
+                body=body
+            )
+            if status_code != 201:
+                raise utils.SpotifyError(status_code, response_json)
 
 
     def update_name(self, name):
@@ -267,7 +306,7 @@ class Playlist:
         Calls endpoints:
             - PUT /v1/playlists/{playlist_id}
         """
-        endpoint = Endpoints.PLAYLIST % self.spotify_id()
+        endpoint = self._endpoint
         if not isinstance(name, str):
             raise TypeError('The name must be a string')
         body = {}
@@ -296,7 +335,7 @@ class Playlist:
         Calls endpoints:
             - PUT /v1/playlists/{playlist_id}
         """
-        endpoint = Endpoints.PLAYLIST % self.spotify_id()
+        endpoint = self._endpoint
         if not isinstance(description, str):
             raise TypeError('The description must be a string')
         body = {}
@@ -329,7 +368,7 @@ class Playlist:
         Calls endpoints:
             - PUT /v1/playlists/{playlist_id}
         """
-        endpoint = Endpoints.PLAYLIST % self.spotify_id()
+        endpoint = self._endpoint
         body = {}
         if visibility not in [const.PUBLIC, const.PRIVATE,
                               const.PRIVATE_COLLAB]:
@@ -357,9 +396,9 @@ class Playlist:
             None: if the Playlist has no cover image.
 
         Calls endpoints:
-            - PUT /v1/playlists/{playlist_id}
+            - GET /v1/playlists/{playlist_id}/images
         """
-        endpoint = Endpoints.PLAYLIST_IMAGES % self.spotify_id()
+        endpoint = self._images_endpoint
         response_json, status_code = utils.request(
             self._session,
             request_type='GET',
@@ -406,7 +445,7 @@ class Playlist:
         Calls endpoints:
             - GET /v1/playlists/{playlist_id}/tracks
         """
-        endpoint = Endpoints.PLAYLIST_TRACKS % self.spotify_id()
+        endpoint = self._tracks_endpoint
         if not isinstance(start, int):
             raise TypeError('The start index must be an integer')
         original_start = start
@@ -423,9 +462,17 @@ class Playlist:
             num_tracks = sys.maxsize
         uri_params = {}
         uri_params['market'] = market
-        tracks = utils.paginate_get(self._session, num_tracks, Track,
-                                    endpoint, uri_params=uri_params)
-        return tracks[start:]
+
+        # Pages are as large as Spotify allows and start at 'start', so no
+        # tracks before it are requested.
+        return utils.paginate_get(self._session,
+                                  num_tracks,
+                                  Track,
+                                  endpoint,
+                                  uri_params=uri_params,
+                                  page_size=const.SPOTIFY_PLAYLIST_PAGE_SIZE,
+                                  start=start,
+                                  item_key='track')
 
     # TODO test this in practice, what does it actually mean? Nobody knows.
     # TODO condense this messiness
@@ -457,16 +504,17 @@ class Playlist:
         Calls endpoints:
             - DELETE /v1/playlists/{playlist_id}/tracks
         """
-        endpoint = Endpoints.PLAYLIST_TRACKS % self.spotify_id()
+        endpoint = self._tracks_endpoint
         body = {}
         body['tracks'] = []
         if tracks is not None and positions is None:
             if not isinstance(tracks, list):
                 tracks = [tracks]
+            playlist_tracks = set(self._tracks)
             for track in tracks:
                 if not isinstance(track, Track):
                     raise TypeError('The tracks must be Track objects')
-                if not track in self:
+                if not track in playlist_tracks:
                     raise ValueError('All tracks must be in the playlist')
                 track_info = {}
                 track_info['uri'] = track.uri()
@@ -479,27 +527,33 @@ class Playlist:
                     raise TypeError('The positions must be integers')
                 if position < 0 or position >= len(self):
                     raise ValueError(f'Invalid position: {position}')
-            if tracks is None:
-                all_tracks = self.tracks()
-                tracks = [all_tracks[i] for i in range(len(all_tracks))
-                          if i in positions]
-            for i, track in enumerate(tracks):
-                if i in positions:
-                    track_info = {}
-                    track_info['uri'] = track['uri']
-                    track_info['positions'] = [i]
-                    body['tracks'].append(track_info)
+            # Positions take precedence, so any given tracks are ignored. The
+            # positions were validated against self._tracks, so index it
+            # directly. Duplicate positions are dropped.
+            for position in sorted(set(positions)):
+                track_info = {}
+                track_info['uri'] = self._tracks[position].uri()
+                track_info['positions'] = [position]
+                body['tracks'].append(track_info)
         else:
             raise ValueError('Neither tracks nor positions were provided')
 
-        response_json, status_code = utils.request(
-            self._session,
-            request_type='DELETE',
-            endpoint=endpoint,
-            body=body
-        )
-        if status_code != 200:
-            raise utils.SpotifyError(status_code, response_json)
+        # Spotify accepts at most 100 tracks per request. The entries are in
+        # increasing position order, so removing the last batch first keeps
+        # the positions in the earlier batches valid.
+        batches = list(utils.create_batches(
+            body['tracks'],
+            batch_size=const.SPOTIFY_PLAYLIST_PAGE_SIZE
+        ))
+        for batch in reversed(batches):
+            response_json, status_code = utils.request(
+                self._session,
+                request_type='DELETE',
+                endpoint=endpoint,
+                body={'tracks': batch}
+            )
+            if status_code != 200:
+                raise utils.SpotifyError(status_code, response_json)
 
 
     # TODO test overlapping source/dest
@@ -537,7 +591,7 @@ class Playlist:
         Calls endpoints:
             - PUT /v1/playlists/{playlist_id}/tracks
         """
-        endpoint = Endpoints.PLAYLIST_TRACKS % self.spotify_id()
+        endpoint = self._tracks_endpoint
         if not isinstance(source_index, int):
             raise TypeError('The source index must be an integer')
         if not isinstance(dest_index, int):
@@ -578,6 +632,9 @@ class Playlist:
 
         Warning:
             All previously present tracks in the playlist will be removed.
+            Spotify replaces at most 100 tracks at once, so when given more,
+            the playlist is briefly left with only the first 100 tracks while
+            the rest are added.
 
         Required token scopes:
             - playlist-modify-public: If the playlist is public.
@@ -586,20 +643,32 @@ class Playlist:
 
         Calls endpoints:
             - PUT /v1/playlists/{playlist_id}/tracks
+            - POST /v1/playlists/{playlist_id}/tracks
         """
-        endpoint = Endpoints.PLAYLIST_TRACKS % self.spotify_id()
+        endpoint = self._tracks_endpoint
         if not all([isinstance(track, Track) for track in tracks]):
             raise TypeError('All elements of tracks must be Track objects')
-        body = {}
-        body['uris'] = [track.uri() for track in tracks]
-        response_json, status_code = utils.request(
-            self._session,
-            request_type='PUT',
-            endpoint=endpoint,
-            body=body
+        uris = [track.uri() for track in tracks]
+
+        # Spotify accepts at most 100 uris per request. The first batch
+        # replaces the tracks, and the rest are appended in order.
+        page_size = const.SPOTIFY_PLAYLIST_PAGE_SIZE
+        batches = [('PUT', uris[:page_size])]
+        batches.extend(
+            ('POST', batch)
+            for batch in utils.create_batches(uris[page_size:], page_size)
         )
-        if status_code != 201:
-            raise utils.SpotifyError(status_code, response_json)
+        for request_type, batch in batches:
+            body = {}
+            body['uris'] = batch
+            response_json, status_code = utils.request(
+                self._session,
+                request_type=request_type,
+                endpoint=endpoint,
+                body=body
+            )
+            if status_code != 201:
+                raise utils.SpotifyError(status_code, response_json)
 
 
     # TODO test this, no example in web api reference
@@ -607,12 +676,16 @@ class Playlist:
         """ Replace the playlist cover image.
 
         Note:
-            The image must be a JPEG and can be at most 256 KB in size.
+            The image must be a JPEG and can be at most 256 KB in size once
+            base64 encoded, which is about 192 KB for the file.
 
         Args:
             path: A string containing the path to the image to use as the
                 playlist cover image. The image must be a JPEG up to 256 KB.
 
+        Raises:
+            ValueError: if the image is not a JPEG or is too large.
+
         Required token scopes:
             - ugc-image-upload
             - playlist-modify-public: If the playlist is public.
@@ -622,15 +695,21 @@ class Playlist:
         Calls endpoints:
             - PUT /v1/playlists/{playlist_id}/images
         """
-        endpoint = Endpoints.BASE_URI
-        endpoint += Endpoints.PLAYLIST_IMAGES % self.spotify_id()
+        endpoint = self._images_endpoint
         mime_type, _ = mimetypes.guess_type(path)
         if mime_type != 'image/jpeg':
             raise ValueError('The image must be an image/jpeg')
 
-        body = []
+        # Spotify limits the size of the base64 encoded image, which takes 4
+        # bytes for every 3 in the file. Check it before reading the file.
+        encoded_size = 4 * ((os.path.getsize(path) + 2) // 3)
+        if encoded_size > const.MAX_IMAGE_SIZE:
+            raise ValueError('The image must be at most 256 KB when base64 ' +
+                             f'encoded, not {encoded_size} bytes')
+
+        # The body is the encoded image itself, not json
         with open(path, 'rb') as fp:
-            body.append(base64.b64encode(fp.read()))
+            body = base64.b64encode(fp.read())
 
         response_json, status_code = utils.request(
             self._session,
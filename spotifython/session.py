@@ -1,7 +1,16 @@
 """ Session class. """
+#pylint: disable=too-many-lines
 
 # Standard library imports
-import math
+from collections import OrderedDict
+import weakref
+
+# Optional third party imports. numpy is only needed by audio_features_array.
+try:
+    #pylint: disable=import-error
+    import numpy as np
+except ImportError:
+    np = None
 
 # Local imports
 import spotifython.constants as const
@@ -9,13 +18,19 @@ from spotifython.endpoints import Endpoints
 import spotifython.utils as utils
 
 class Session:
+    #pylint: disable=too-many-instance-attributes
     """ Represents an interactive Spotify session, tied to a Spotify API token.
 
     Use methods here to deal with authentication, searching for objects, and
     getting objects by their ids.
     """
 
-    def __init__(self, token, timeout=const.DEFAULT_REQUEST_TIMEOUT):
+    def __init__(self,
+                 token,
+                 timeout=const.DEFAULT_REQUEST_TIMEOUT,
+                 max_workers=const.DEFAULT_MAX_WORKERS,
+                 rate_limit=None,
+                 cache_size=const.DEFAULT_CACHE_SIZE):
         """ Create a new Spotify Session.
 
         This is the only constructor that should be explicitly called by the
@@ -26,6 +41,21 @@ class Session:
             timeout (int): timeout value for each request made to Spotify's API.
                 Default 10. This library uses exponential backoff with a
                 timeout; this parameter is the hard timeout.
+            max_workers (int): the max number of requests to have in flight at
+                once when a call needs several pages or batches from Spotify.
+                Default 1, which sends requests one at a time. Spotify rate
+                limits clients that send too many requests at once, so values
+                above 2 or 3 are likely to slow calls down rather than speed
+                them up.
+            rate_limit (int, float): the max average number of requests per
+                second to send to Spotify. Requests over the limit wait until
+                they can be sent, instead of being rate limited by Spotify.
+                Default None, which doesn't limit requests.
+            cache_size (int): the max number of GET responses to keep in
+                memory. Responses are reused only for as long as Spotify's
+                Cache-Control header allows. Audio features are also kept for
+                up to 100 times this many tracks. Default 256. Use 0 to disable
+                caching.
 
         Raises:
             TypeError:  if incorrectly typed parameters are given.
@@ -37,9 +67,40 @@ class Session:
             raise TypeError('timeout should be int')
         if timeout < 0:
             raise ValueError(f'timeout {timeout} is < 0')
+        if not isinstance(max_workers, int):
+            raise TypeError('max_workers should be int')
+        if max_workers < 1:
+            raise ValueError(f'max_workers {max_workers} is < 1')
+        if rate_limit is not None and \
+            not isinstance(rate_limit, (int, float)):
+            raise TypeError('rate_limit should be None or a number')
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError(f'rate_limit {rate_limit} is <= 0')
+        if not isinstance(cache_size, int):
+            raise TypeError('cache_size should be int')
+        if cache_size < 0:
+            raise ValueError(f'cache_size {cache_size} is < 0')
 
         self._token = token
         self._timeout = timeout
+        self._max_workers = max_workers
+
+        # Shared by all requests made with this Session for connection reuse.
+        # It sends the token with every request.
+        self._http = utils.create_http_session(max_workers)
+        self._http.headers['Authorization'] = 'Bearer ' + token
+        self._rate_limiter = None if rate_limit is None \
+            else utils.RateLimiter(rate_limit)
+        self._cache = None if cache_size == 0 \
+            else utils.ResponseCache(cache_size)
+        # Albums and artists shared between objects, by (class, Spotify id)
+        self._shared_objects = weakref.WeakValueDictionary()
+        # Audio features by track id, least recently used first. Spotify
+        # computes them once per track. Each batch response holds up to 100
+        # tracks' features, so this holds as much as cache_size responses.
+        self._audio_features = OrderedDict()
+        self._audio_features_size = \
+            cache_size * const.SPOTIFY_AUDIO_FEATURES_PAGE_SIZE
 
 
     def reauthenticate(self, token):
@@ -51,7 +112,29 @@ class Session:
         if not isinstance(token, str):
             raise TypeError('token should be string')
 
+        # Responses such as the current user depend on whose token it is
+        if self._cache is not None:
+            self._cache.clear()
+
         self._token = token
+        self._http.headers['Authorization'] = 'Bearer ' + token
+
+
+    def close(self):
+        """ Closes the connections kept open to Spotify.
+
+        A Session can also be used as a context manager, which closes it on
+        exit. Requests made after closing open new connections as needed.
+        """
+        self._http.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
     def token(self):
@@ -70,6 +153,14 @@ class Session:
         return self._timeout
 
 
+    def max_workers(self):
+        """
+        Returns:
+            int: The max number of requests this session sends at once.
+        """
+        return self._max_workers
+
+
     def __str__(self):
         """ Returns the Session's id.
 
@@ -100,6 +191,8 @@ class Session:
         :meth:`Session.search() <spotifython.session.Session.search>`
         """
 
+        __slots__ = ('_albums', '_artists', '_playlists', '_tracks')
+
         def __init__(self, search_result):
             """ Get an instance of SearchResult. Client should not use this!
 
@@ -238,10 +331,11 @@ class Session:
         # Internally, include_external='audio' is the only valid argument.
 
         # Type validation
-        if not all(isinstance(x, str) for x in query):
+        if not isinstance(query, str):
             raise TypeError('query should be str')
         if not isinstance(types, str) and \
-            not all(isinstance(x, str) for x in types):
+            not (isinstance(types, list) and
+                 all(isinstance(x, str) for x in types)):
             raise TypeError('types should be str or a list of str')
         if (limit is not None and not isinstance(limit, int)) or \
             (isinstance(limit, int) and limit < 1):
@@ -254,121 +348,138 @@ class Session:
 
         # Argument validation
         if isinstance(types, str):
-            types = list(types)
-        valid_types = [
-            const.ALBUMS,
-            const.ARTISTS,
-            const.PLAYLISTS,
-            const.TRACKS
-        ]
+            types = [types]
         for search_type_filter in types:
-            if search_type_filter not in valid_types:
+            if search_type_filter not in _SEARCH_TYPES:
                 raise ValueError(f'search type {search_type_filter} invalid')
         if limit is None:
             limit = 2000
         if limit > 2000:
             raise ValueError('Spotify only supports up to 2000 search results.')
 
-        # Construct params for API call
+        # Construct the params shared by every page once. requests encodes the
+        # query, spaces included, so it is passed as is: replacing spaces with
+        # '+' would send a literal '+' (%2B) to Spotify.
         uri_params = dict()
-        # Encode the spaces in strings! See the following link for more details.
-        # https://developer.spotify.com/documentation/web-api/reference/search/search/
-        uri_params['q'] = query.replace(' ', '+')
+        uri_params['q'] = query
         if market is not None:
             uri_params['market'] = market
         if include_external_audio:
             uri_params['include_external'] = 'audio'
 
-        # A maximum of 50 search results per search type can be returned per API
-        # call to the search backend
-        next_multiple = lambda num, mult: math.ceil(num / mult) * mult
-        num_to_request = next_multiple(limit, const.SPOTIFY_PAGE_SIZE)
-
-        # We want the singular search types, while our constants are plural
-        # search types in the argument for uniformity. The pagination objects
-        # use the plural types again, so a two way mapping is required.
-        map_args_to_api_call = {
-            const.ALBUMS: 'album',
-            const.ARTISTS: 'artist',
-            const.PLAYLISTS: 'playlist',
-            const.TRACKS: 'track',
-            const.SHOWS: 'show',
-            const.EPISODES: 'episode',
-        }
-        map_args_to_api_result = {
-            'album': const.ALBUMS,
-            'artist': const.ARTISTS,
-            'playlist': const.PLAYLISTS,
-            'track': const.TRACKS,
-            'show': const.SHOWS,
-            'episode': const.EPISODES,
-        }
-        remaining_types = [map_args_to_api_call.get(s) for s in types]
+        # Our constants are the plural search types, which Spotify also uses as
+        # the keys of its results. Each type is only searched for once.
+        search_types = list(dict.fromkeys(types))
 
         # Initialize SearchResult object
-        result = {
-            map_args_to_api_call[const.ALBUMS]: list(),
-            map_args_to_api_call[const.ARTISTS]: list(),
-            map_args_to_api_call[const.PLAYLISTS]: list(),
-            map_args_to_api_call[const.TRACKS]: list(),
-        }
+        result = {api_type: list() for api_type, _ in _SEARCH_TYPES.values()}
 
         # Unfortunately because each type can have a different amount of return
         # values, utils.paginate_get() is not suited for this call.
-        for offset in range(0, num_to_request, const.SPOTIFY_PAGE_SIZE):
-            # This line simplifies the logic for cases where an extra request
-            # would otherwise be needed to hit the empty list check in the
-            # search responses.
-            if len(remaining_types) == 0:
-                break
-
-            uri_params['type'] = ','.join(remaining_types)
-            uri_params['limit'] = limit
-            uri_params['offset'] = offset
+        def get_page(page):
+            offset, page_types = page
+            # Each page holds at most 50 results per type, and the last page
+            # only asks for the results that are still needed
+            page_params = dict(uri_params,
+                               type=','.join(_SEARCH_TYPES[curr_type][0]
+                                             for curr_type in page_types),
+                               limit=min(const.SPOTIFY_PAGE_SIZE,
+                                         limit - offset),
+                               offset=offset)
 
             # Execute requests
             response_json, status_code = utils.request(
                 session=self,
                 request_type=const.REQUEST_GET,
                 endpoint=Endpoints.SEARCH,
-                uri_params=uri_params
+                uri_params=page_params
             )
 
             if status_code != 200:
                 raise utils.SpotifyError(status_code, response_json)
 
-            # Extract data per search type
-            # TODO: test what happens if unnecessary types are specified for
-            # the given offsets against live api
-            for curr_type in remaining_types:
-                api_result_type = map_args_to_api_result[curr_type]
-                items = response_json[api_result_type]['items']
-
-                # Add items to accumulator
-                for item in items:
-                    if curr_type is map_args_to_api_call[const.ALBUMS]:
-                        result.get(curr_type).append(Album(self, item))
-                    elif curr_type is map_args_to_api_call[const.ARTISTS]:
-                        result.get(curr_type).append(Artist(self, item))
-                    elif curr_type is map_args_to_api_call[const.PLAYLISTS]:
-                        result.get(curr_type).append(Playlist(self, item))
-                    elif curr_type is map_args_to_api_call[const.TRACKS]:
-                        result.get(curr_type).append(Track(self, item))
-                    else:
-                        # Should never reach here, but here for safety!
-                        raise ValueError('Invalid type when building search')
-
-            # Only make necessary search queries
-            new_remaining_types = list()
-            for curr_type in remaining_types:
-                api_result_type = map_args_to_api_result[curr_type]
-                if response_json[api_result_type]['next'] is not None:
-                    new_remaining_types.append(curr_type)
-            remaining_types = new_remaining_types
+            return page_types, response_json
+
+        # The first page gives the total number of results of each type, so
+        # the rest of the pages can be requested at once. Each page only asks
+        # for the types that still have results at its offset.
+        first_page = get_page((0, search_types))
+        totals = {curr_type: first_page[1][curr_type]['total']
+                  for curr_type in search_types}
+        # A maximum of 50 search results per search type can be returned per API
+        # call to the search backend, so a page starts every 50 results until
+        # the limit.
+        pages = []
+        for offset in range(const.SPOTIFY_PAGE_SIZE,
+                            limit,
+                            const.SPOTIFY_PAGE_SIZE):
+            page_types = [curr_type for curr_type in search_types
+                          if offset < totals[curr_type]]
+            if page_types:
+                pages.append((offset, page_types))
+
+        responses = [first_page] + utils.concurrent_map(self, get_page, pages)
+
+        # Extract data per search type
+        for page_types, response_json in responses:
+            for curr_type in page_types:
+                api_type, result_class = _SEARCH_TYPES[curr_type]
+                items = response_json[curr_type]['items']
+                result[api_type].extend(result_class(self, item)
+                                        for item in items)
 
         return self.SearchResult(result)
 
 
+    def _get_several(self,
+                     spotify_ids,
+                     endpoint,
+                     return_class,
+                     batch_size,
+                     uri_params=None):
+        """ Get objects with a "Get Several" endpoint, such as GET /v1/albums.
+
+        get_albums, get_artists and get_tracks only differ in these arguments,
+        so this implements them to remove duplicate code.
+
+        Args:
+            spotify_ids (List[str]): the ids of the objects to get.
+            endpoint (str): the endpoint. Its responses hold the objects under
+                the same key, such as 'albums' for 'albums'.
+            return_class: the class of the objects.
+            batch_size (int): the max number of ids per request.
+            uri_params (dict): params to send with every request, besides ids.
+
+        Returns:
+            Union[return_class, List[return_class]]: the object, if there is
+            only one, or the objects in the order of spotify_ids.
+        """
+        uri_params = dict() if uri_params is None else uri_params
+
+        def get_batch(batch):
+            # Execute requests
+            response_json, status_code = utils.request(
+                session=self,
+                request_type=const.REQUEST_GET,
+                endpoint=endpoint,
+                uri_params=dict(uri_params, ids=','.join(batch))
+            )
+
+            if status_code != 200:
+                raise utils.SpotifyError(status_code, response_json)
+
+            return [return_class(self, item)
+                    for item in response_json[endpoint]]
+
+        # The batches are independent, so they can be requested concurrently
+        batches = utils.create_batches(spotify_ids, batch_size)
+        result = [elem
+                  for page in utils.concurrent_map(self, get_batch, batches)
+                  for elem in page]
+
+        return result if len(result) != 1 else result[0]
+
+
     def get_albums(self,
                    album_ids,
                    market=const.TOKEN_REGION):
@@ -397,8 +508,9 @@ class Session:
         """
 
         # Type/Argument validation
-        if not isinstance(album_ids, str) and\
-            not all(isinstance(x, str) for x in album_ids):
+        if not isinstance(album_ids, str) and \
+            not (isinstance(album_ids, list) and
+                 all(isinstance(x, str) for x in album_ids)):
             raise TypeError('album_ids should be str or list of str')
         if market is None:
             raise ValueError('market is a required argument')
@@ -406,37 +518,19 @@ class Session:
             raise TypeError('market should be str')
 
         if isinstance(album_ids, str):
-            album_ids = list(album_ids)
+            album_ids = [album_ids]
 
         # Construct params for API call
-        endpoint = Endpoints.SEARCH_ALBUMS
         uri_params = dict()
         if market is not None:
             uri_params['market'] = market
 
         # A maximum 20 albums can be returned per API call
-        batches = utils.create_batches(album_ids, 20)
-
-        result = list()
-        for batch in batches:
-            uri_params['ids'] = ','.join(batch)
-
-            # Execute requests
-            response_json, status_code = utils.request(
-                session=self,
-                request_type=const.REQUEST_GET,
-                endpoint=endpoint,
-                uri_params=uri_params
-            )
-
-            if status_code != 200:
-                raise utils.SpotifyError(status_code, response_json)
-
-            items = response_json['albums']
-            for item in items:
-                result.append(Album(self, item))
-
-        return result if len(result) != 1 else result[0]
+        return self._get_several(album_ids,
+                                 Endpoints.SEARCH_ALBUMS,
+                                 Album,
+                                 batch_size=20,
+                                 uri_params=uri_params)
 
 
     def get_artists(self, artist_ids):
@@ -460,40 +554,19 @@ class Session:
         """
 
         # Type validation
-        if not isinstance(artist_ids, str) and\
-            not all(isinstance(x, str) for x in artist_ids):
+        if not isinstance(artist_ids, str) and \
+            not (isinstance(artist_ids, list) and
+                 all(isinstance(x, str) for x in artist_ids)):
             raise TypeError('artist_ids should be str or list of str')
 
         if isinstance(artist_ids, str):
-            artist_ids = list(artist_ids)
-
-        # Construct params for API call
-        endpoint = Endpoints.SEARCH_ALBUMS
-        uri_params = dict()
+            artist_ids = [artist_ids]
 
         # A maximum of 50 artists can be returned per API call
-        batches = utils.create_batches(artist_ids, 50)
-
-        result = list()
-        for batch in batches:
-            uri_params['ids'] = batch
-
-            # Execute requests
-            response_json, status_code = utils.request(
-                session=self,
-                request_type=const.REQUEST_GET,
-                endpoint=endpoint,
-                uri_params=uri_params
-            )
-
-            if status_code != 200:
-                raise utils.SpotifyError(status_code, response_json)
-
-            items = response_json['artists']
-            for item in items:
-                result.append(Artist(self, item))
-
-        return result if len(result) != 1 else result[0]
+        return self._get_several(artist_ids,
+                                 Endpoints.SEARCH_ARTISTS,
+                                 Artist,
+                                 batch_size=50)
 
 
     def get_tracks(self,
@@ -524,47 +597,279 @@ class Session:
         """
 
         # Type validation
-        if not isinstance(track_ids, str) and\
-            not all(isinstance(x, str) for x in track_ids):
+        if not isinstance(track_ids, str) and \
+            not (isinstance(track_ids, list) and
+                 all(isinstance(x, str) for x in track_ids)):
             raise TypeError('track_ids should be str or list of str')
         if market is not None and not isinstance(market, str):
             raise TypeError('market should be None or str')
 
         # Argument validation
         if isinstance(track_ids, str):
-            track_ids = list(track_ids)
+            track_ids = [track_ids]
 
         # Construct params for API call
-        endpoint = Endpoints.SEARCH_TRACKS
         uri_params = dict()
         if market is not None:
             uri_params['market'] = market
 
         # A maximum of 50 tracks can be returned per API call
-        batches = utils.create_batches(track_ids, 50)
+        return self._get_several(track_ids,
+                                 Endpoints.SEARCH_TRACKS,
+                                 Track,
+                                 batch_size=50,
+                                 uri_params=uri_params)
 
-        result = list()
-        for batch in batches:
-            uri_params['ids'] = ','.join(batch)
 
-            # Execute requests
+    def load_tracks(self, tracks):
+        """ Loads the full details of many tracks, 50 tracks per request.
+
+        Some endpoints, such as an album's tracks, return simplified tracks
+        without fields such as popularity. Each of those tracks fetches its
+        missing fields on its own the first time one is needed, which is one
+        request per track. Loading them here first is one request per 50.
+
+        Args:
+            tracks (Track, List[Track]): the track(s) to load. Tracks that
+                already have their full details are skipped.
+
+        Raises:
+            TypeError: for invalid types in any argument.
+            HTTPError: if failure or partial failure.
+
+        Calls endpoints:
+            - GET   /v1/tracks
+        """
+        #pylint: disable=protected-access
+
+        # Type validation
+        if not isinstance(tracks, Track) and \
+            not (isinstance(tracks, list) and
+                 all(isinstance(x, Track) for x in tracks)):
+            raise TypeError('tracks should be Track or list of Track')
+
+        if isinstance(tracks, Track):
+            tracks = [tracks]
+
+        # The same track can appear more than once, and is only requested once
+        tracks_by_id = dict()
+        for track in tracks:
+            if not track._is_full():
+                tracks_by_id.setdefault(track.spotify_id(), []).append(track)
+
+        def get_batch(batch):
             response_json, status_code = utils.request(
                 session=self,
                 request_type=const.REQUEST_GET,
-                endpoint=endpoint,
-                uri_params=uri_params
+                endpoint=Endpoints.SEARCH_TRACKS,
+                uri_params={'ids': ','.join(batch)}
             )
 
             if status_code != 200:
                 raise utils.SpotifyError(status_code, response_json)
 
-            items = response_json['tracks']
+            return response_json['tracks']
+
+        batches = utils.create_batches(list(tracks_by_id), 50)
+        for items in utils.concurrent_map(self, get_batch, batches):
             for item in items:
-                result.append(Track(self, item))
+                # Unknown ids come back as None
+                if item is None:
+                    continue
+                for track in tracks_by_id[item['id']]:
+                    track._raw.update(item)
+
+
+    def get_audio_features(self, tracks):
+        #pylint: disable=line-too-long
+        """ Gets the audio features for the given tracks.
+
+        Features already fetched by this Session are reused, and the rest are
+        requested 100 tracks at a time.
+
+        For more information on track audio features, see Spotify's
+        `documentation <https://developer.spotify.com/documentation/web-api/reference/object-model/#audio-features-object>`__
+
+        Args:
+            tracks (Track, List[Track]): the track(s) to get features for.
+
+        Returns:
+            Union[dict, List[dict]]: the audio features of each track, in the
+            same order as tracks.
+
+        Raises:
+            TypeError: for invalid types in any argument.
+            HTTPError: if failure or partial failure.
+            SpotifyError: if Spotify has no audio features for one of tracks,
+                such as a local track.
+
+        Calls endpoints:
+            - GET     /v1/audio-features
+        """
+        result = self._fetch_audio_features(tracks)
+        if isinstance(tracks, Track):
+            tracks = [tracks]
+
+        for track, features in zip(tracks, result):
+            if features is None:
+                raise utils.SpotifyError(
+                    f'no audio features for track {track.spotify_id()}'
+                )
 
         return result if len(result) != 1 else result[0]
 
 
+    def _fetch_audio_features(self, tracks):
+        """ Gets the audio features for the given tracks.
+
+        Args:
+            tracks (Track, List[Track]): the track(s) to get features for.
+
+        Returns:
+            List[dict]: a copy of the audio features of each track, in the same
+            order as tracks. None for tracks that Spotify has no features for.
+        """
+
+        # Type validation
+        if not isinstance(tracks, Track) and \
+            not (isinstance(tracks, list) and
+                 all(isinstance(x, Track) for x in tracks)):
+            raise TypeError('tracks should be Track or list of Track')
+
+        if isinstance(tracks, Track):
+            tracks = [tracks]
+
+        track_ids = [track.spotify_id() for track in tracks]
+        found = {}
+        for track_id in track_ids:
+            if track_id in self._audio_features:
+                self._audio_features.move_to_end(track_id)
+                found[track_id] = self._audio_features[track_id]
+        missing = list(dict.fromkeys(
+            track_id for track_id in track_ids if track_id not in found
+        ))
+
+        def get_batch(batch):
+            response_json, status_code = utils.request(
+                session=self,
+                request_type=const.REQUEST_GET,
+                endpoint=Endpoints.SEARCH_AUDIO_FEATURES,
+                uri_params={'ids': ','.join(batch)}
+            )
+
+            if status_code != 200:
+                raise utils.SpotifyError(status_code, response_json)
+
+            return response_json['audio_features']
+
+        batches = list(utils.create_batches(
+            missing,
+            const.SPOTIFY_AUDIO_FEATURES_PAGE_SIZE
+        ))
+        pages = utils.concurrent_map(self, get_batch, batches)
+        for batch, page in zip(batches, pages):
+            for track_id, features in zip(batch, page):
+                found[track_id] = features
+                # Spotify returns null for ids without features, such as local
+                # tracks. Those are asked for again next time.
+                if features is not None and self._audio_features_size > 0:
+                    self._audio_features[track_id] = features
+
+        # Evict the least recently used features
+        while len(self._audio_features) > self._audio_features_size:
+            self._audio_features.popitem(last=False)
+
+        # Copied so that callers can't modify the cached features
+        return [None if found[track_id] is None else dict(found[track_id])
+                for track_id in track_ids]
+
+
+    def audio_features_array(self, tracks):
+        """ Gets the audio features of the given tracks as a numpy array.
+
+        Requires numpy. The features are fetched as with
+        :meth:`get_audio_features`, then packed into one dense array, which
+        is much faster to aggregate over than a list of dicts.
+
+        Args:
+            tracks (Track, List[Track]): the track(s) to get features for.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: the ids of the tracks, and a
+            float32 array of shape (len(tracks), len(AUDIO_FEATURE_KEYS)).
+            Row i holds the features of track i, with columns in the order
+            of constants.AUDIO_FEATURE_KEYS. Rows of tracks that Spotify has
+            no features for are all NaN.
+
+        Raises:
+            ImportError: if numpy is not installed.
+            TypeError: for invalid types in any argument.
+            HTTPError: if failure or partial failure.
+
+        Calls endpoints:
+            - GET     /v1/audio-features
+        """
+        if np is None:
+            raise ImportError('audio_features_array requires numpy')
+
+        features = self._fetch_audio_features(tracks)
+        if isinstance(tracks, Track):
+            tracks = [tracks]
+
+        ids = np.array([track.spotify_id() for track in tracks])
+        values = np.full(
+            (len(tracks), len(const.AUDIO_FEATURE_KEYS)),
+            np.nan,
+            dtype=np.float32
+        )
+        for row, track_features in enumerate(features):
+            if track_features is not None:
+                values[row] = [
+                    track_features[key] for key in const.AUDIO_FEATURE_KEYS
+                ]
+
+        return ids, values
+
+
+    def get_audio_analysis(self, tracks):
+        """ Gets the audio analysis of the given tracks.
+
+        Spotify has no endpoint for the analysis of several tracks, so the
+        requests are made concurrently when the session allows it (see the
+        max_workers argument of :class:`Session`). Each analysis is kept by its
+        Track, as with :meth:`Track.audio_analysis()
+        <spotifython.track.Track.audio_analysis>`.
+
+        Args:
+            tracks (Track, List[Track]): the track(s) to get the analysis of.
+
+        Returns:
+            Union[dict, List[dict]]: the audio analysis of each track, in the
+            same order as tracks.
+
+        Raises:
+            TypeError: for invalid types in any argument.
+            HTTPError: if failure or partial failure.
+
+        Calls endpoints:
+            - GET     /v1/audio-analysis/{id}
+        """
+
+        # Type validation
+        if not isinstance(tracks, Track) and \
+            not (isinstance(tracks, list) and
+                 all(isinstance(x, Track) for x in tracks)):
+            raise TypeError('tracks should be Track or list of Track')
+
+        if isinstance(tracks, Track):
+            tracks = [tracks]
+
+        result = utils.concurrent_map(self,
+                                      lambda track: track.audio_analysis(),
+                                      tracks)
+        return result if len(result) != 1 else result[0]
+
+
     # TODO: what the heck are fields?
     def get_playlists(self,
                       playlist_ids,
@@ -602,8 +907,9 @@ class Session:
         # has been deprecated and therefore is removed from the API wrapper.
 
         # Type/Argument validation
-        if not isinstance(playlist_ids, str) and\
-            not all(isinstance(x, str) for x in playlist_ids):
+        if not isinstance(playlist_ids, str) and \
+            not (isinstance(playlist_ids, list) and
+                 all(isinstance(x, str) for x in playlist_ids)):
             raise TypeError('playlist_ids should be str or list of str')
         if fields is not None and not isinstance(fields, str):
             raise TypeError('fields should be None or str')
@@ -611,7 +917,7 @@ class Session:
             raise TypeError('market should be str')
 
         if isinstance(playlist_ids, str):
-            playlist_ids = list(playlist_ids)
+            playlist_ids = [playlist_ids]
 
         # Construct params for API call
         uri_params = dict()
@@ -620,9 +926,8 @@ class Session:
             uri_params['fields'] = fields
 
         # Each API call can return at most 1 playlist. Therefore there is no
-        # need to batch this query.
-        result = list()
-        for playlist_id in playlist_ids:
+        # need to batch this query, but the calls can be made concurrently.
+        def get_playlist(playlist_id):
             endpoint = Endpoints.SEARCH_PLAYLIST % playlist_id
 
             # Execute requests
@@ -636,8 +941,9 @@ class Session:
             if status_code != 200:
                 raise utils.SpotifyError(status_code, response_json)
 
-            result.append(Playlist(self, response_json))
+            return Playlist(self, response_json)
 
+        result = utils.concurrent_map(self, get_playlist, playlist_ids)
         return result if len(result) != 1 else result[0]
 
 
@@ -659,20 +965,20 @@ class Session:
         """
 
         # Type validation
-        if not isinstance(user_ids, str) and\
-            not all(isinstance(x, str) for x in user_ids):
+        if not isinstance(user_ids, str) and \
+            not (isinstance(user_ids, list) and
+                 all(isinstance(x, str) for x in user_ids)):
             raise TypeError('user_ids should be str or list of str')
 
         if isinstance(user_ids, str):
-            user_ids = list('user_ids should be str')
+            user_ids = [user_ids]
 
         # Construct params for API call
         uri_params = dict()
 
         # Each API call can return at most 1 user. Therefore there is no need
-        # to batch this query.
-        result = list()
-        for user_id in user_ids:
+        # to batch this query, but the calls can be made concurrently.
+        def get_user(user_id):
             # Execute requests
             # TODO: Partial failure - if user with user_id does not exist,
             # status_code is 404
@@ -686,8 +992,9 @@ class Session:
             if status_code != 200:
                 raise utils.SpotifyError(status_code, response_json)
 
-            result.append(User(self, response_json))
+            return User(self, response_json)
 
+        result = utils.concurrent_map(self, get_user, user_ids)
         return result if len(result) != 1 else result[0]
 
 
@@ -727,3 +1034,12 @@ from spotifython.artist import Artist
 from spotifython.playlist import Playlist
 from spotifython.track import Track
 from spotifython.user import User
+
+# The type Spotify expects in search requests, and the class of the results,
+# for each type accepted by Session.search
+_SEARCH_TYPES = {
+    const.ALBUMS: ('album', Album),
+    const.ARTISTS: ('artist', Artist),
+    const.PLAYLISTS: ('playlist', Playlist),
+    const.TRACKS: ('track', Track),
+}
@@ -1,7 +1,7 @@
 """ Track class. """
 
 # Standard library imports
-import copy
+import sys
 
 # Local imports
 import spotifython.constants as const
@@ -9,6 +9,10 @@ from spotifython.endpoints import Endpoints
 import spotifython.utils as utils
 
 
+# Fields of the full track object that simplified track objects leave out
+_FULL_FIELDS = ('album', 'external_ids', 'popularity')
+
+
 class Track:
     """ Represents a Spotify track / song tied to a unique Spotify id.
 
@@ -16,13 +20,18 @@ class Track:
     :meth:`Session.get_tracks() <spotifython.session.Session.get_tracks>`. To
     get a track from another object, use appropriate methods such as
     :meth:`Album.tracks() <spotifython.album.Album.tracks>`,
-    :meth:`Playlist.tracks() <spotifython.playlist.Playlist.tracks>`, etc.
+    :meth:`Playlist.tracks() <spotifython.playlist.Playlist.tracks>`, etc. To
+    load the full details of many tracks at once, use
+    :meth:`Session.load_tracks() <spotifython.session.Session.load_tracks>`.
 
     Required token scopes:
         - None: the methods in the Track class require a token, but the token
           needs no scopes.
     """
 
+    __slots__ = ('_id', '_raw', '_session', '_album', '_artists',
+                 '_audio_analysis')
+
 
     def __init__(self, session, info):
         """ Get an instance of Track. Client should not use the constructor!
@@ -35,9 +44,14 @@ class Track:
         if 'id' not in info:
             raise ValueError('Track id not in info')
 
-        self._id = info['id']
+        # The same id is often built into many objects, such as a track in
+        # several playlists, so they share one string
+        self._id = sys.intern(info['id'])
 
-        self._raw = copy.deepcopy(info)
+        # A shallow copy is enough: only the top level of _raw is ever
+        # modified, by _update_fields.
+        self._raw = dict(info)
+        utils.intern_markets(self._raw)
         self._session = session
 
         # Need name in order to print. 'name' should always be in info, so this
@@ -48,6 +62,7 @@ class Track:
         # Cached fields
         self._album = None
         self._artists = None
+        self._audio_analysis = None
 
 
     def __str__(self):
@@ -62,7 +77,10 @@ class Track:
 
     def __eq__(self, other):
         """ Two tracks are equal if they have the same Spotify id. """
-        return utils.spotifython_eq(self, other)
+        # Same as utils.spotifython_eq, inlined since tracks are often kept in
+        # sets and dicts
+        #pylint: disable=unidiomatic-typecheck, protected-access
+        return type(other) is Track and self._id == other._id
 
 
     def __ne__(self, other):
@@ -72,7 +90,8 @@ class Track:
 
     def __hash__(self):
         """ Two equivalent tracks will return the same hashcode. """
-        return utils.spotifython_hash(self)
+        # Same as utils.spotifython_hash, inlined like __eq__
+        return hash((Track, self._id))
 
 
     def __len__(self):
@@ -102,12 +121,15 @@ class Track:
         if status_code != 200:
             raise utils.SpotifyError(status_code, response_json)
 
-        # Updates _raw with new values. One liner : for each key in union of
-        # keys in self._raw and response_json, takes value for key from
-        # response_json if present, else takes value for key from self._raw.
-        # TODO: this is weird notation, make a utility function for it.
-        # Especially useful since it is an action necessary for many classes.
-        self._raw = {**self._raw, **response_json}
+        # Updates _raw in place with the new values
+        self._raw.update(response_json)
+
+
+    def _is_full(self):
+        """ Whether _raw holds the full track object from Spotify, rather than
+        a simplified one such as those in an album's tracks.
+        """
+        return all(field in self._raw for field in _FULL_FIELDS)
 
 
     def spotify_id(self):
@@ -128,7 +150,7 @@ class Track:
         """
         if self._album is None:
             album = utils.get_field(self, 'album')
-            self._album = Album(self._session, album)
+            self._album = utils.get_shared(self._session, Album, album)
 
         return self._album
 
@@ -143,7 +165,8 @@ class Track:
         """
         if self._artists is None:
             artists = utils.get_field(self, 'artists')
-            self._artists = [Artist(self._session, art) for art in artists]
+            self._artists = [utils.get_shared(self._session, Artist, art) \
+                             for art in artists]
 
         return self._artists
 
@@ -271,23 +294,23 @@ class Track:
         For more information on track audio features, see Spotify's
         `documentation <https://developer.spotify.com/documentation/web-api/reference/object-model/#audio-features-object>`__
 
+        The features are cached by the Session. To get the features of many
+        tracks, use :meth:`Session.get_audio_features()
+        <spotifython.session.Session.get_audio_features>`, which batches the
+        requests.
+
         Returns:
             dict: a dictionary as defined at the above link, where the key is
             the audio feature, and the value is the value of that feature.
 
+        Raises:
+            SpotifyError: if Spotify has no audio features for this track, such
+                as a local track.
+
         Calls endpoints:
-            - GET     /v1/audio-features/{id}
+            - GET     /v1/audio-features
         """
-        response_json, status_code = utils.request(
-            session=self._session,
-            request_type=const.REQUEST_GET,
-            endpoint=Endpoints.TRACK_FEATURES % self.spotify_id()
-        )
-
-        if status_code != 200:
-            raise utils.SpotifyError(status_code, response_json)
-
-        return response_json
+        return self._session.get_audio_features(self)
 
 
     # TODO: If Spotify ever freezes the audio analysis, may be worth making into
@@ -303,6 +326,9 @@ class Track:
         For more information on track audio analysis, see Spotify's
         `documentation <https://developer.spotify.com/documentation/web-api/reference/tracks/get-audio-analysis/>`__
 
+        The analysis is fetched once per Track. Later calls return the same
+        dict, so it should not be modified.
+
         Returns:
             dict: a dictionary containing the audio analysis as defined at the
             above link.
@@ -310,6 +336,9 @@ class Track:
         Calls endpoints:
             - GET     /v1/audio-analysis/{id}
         """
+        if self._audio_analysis is not None:
+            return self._audio_analysis
+
         response_json, status_code = utils.request(
             session=self._session,
             request_type=const.REQUEST_GET,
@@ -319,7 +348,9 @@ class Track:
         if status_code != 200:
             raise utils.SpotifyError(status_code, response_json)
 
-        return response_json
+        # Copied so that it doesn't share the Session's cached response
+        self._audio_analysis = dict(response_json)
+        return self._audio_analysis
 
 
 #pylint: disable=wrong-import-position
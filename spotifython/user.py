@@ -13,6 +13,12 @@ import spotifython.utils as utils
 from spotifython.image import Image
 
 
+def _validate_limit(limit, max_limit=sys.maxsize):
+    """ Raise ValueError(limit) unless 1 <= limit <= max_limit. """
+    if not 1 <= limit <= max_limit:
+        raise ValueError(limit)
+
+
 # TODO: what to do about partial success on batch operations?
 class User:
     #pylint: disable=line-too-long
@@ -37,6 +43,8 @@ class User:
           `documentation <https://developer.spotify.com/documentation/web-api/reference/object-model/#followers-object>`__.
     """
 
+    __slots__ = ('_id', '_raw', '_session', '_player')
+
     def __init__(self, session, info):
         """ Get an instance of User. Client should not use the constructor!
 
@@ -52,7 +60,9 @@ class User:
         self._id = info['id']
         self._player = Player(self._session, self)
 
-        self._raw = copy.deepcopy(info)
+        # Copied since _update_fields modifies _raw in place. Only the top
+        # level of _raw is ever modified, so a shallow copy is enough.
+        self._raw = dict(info)
 
         if 'display_name' not in info:
             self._update_fields()
@@ -331,23 +341,15 @@ class User:
         Note: Spotify defines "top items" using internal metrics.
         """
         # Validate arguments
-        if top_type not in [const.ARTISTS, const.TRACKS]:
+        if top_type not in _TOP_TYPES:
             raise TypeError(top_type)
-        if time_range not in [const.LONG, const.MEDIUM, const.SHORT]:
+        if time_range not in _TIME_RANGES:
             raise TypeError(time_range)
-        if limit <= 0:
-            raise ValueError(limit)
+        _validate_limit(limit)
 
         # Parse arguments
-        time_ranges = {
-            const.LONG: 'long_term',
-            const.MEDIUM: 'medium_term',
-            const.SHORT: 'short_term',
-        }
-
-        uri_params = {'time_range': time_ranges[time_range]}
-        endpoint_type = 'artists' if top_type == const.ARTISTS else 'tracks'
-        return_class = Artist if top_type == const.ARTISTS else Track
+        uri_params = {'time_range': _TIME_RANGES[time_range]}
+        endpoint_type, return_class = _TOP_TYPES[top_type]
 
         # Execute requests
         return utils.paginate_get(
@@ -381,8 +383,7 @@ class User:
               Tracks played while in a 'private session' are not recorded.
         """
         # Validate arguments
-        if limit <= 0 or limit > 50:
-            raise ValueError(limit)
+        _validate_limit(limit, 50)
 
         # Execute requests
         response_json, status_code = utils.request(
@@ -396,11 +397,10 @@ class User:
         if status_code != 200:
             raise utils.SpotifyError(status_code, response_json)
 
-        results = []
-        for elem in response_json['items']:
-            results.append(Track(self._session, elem))
-
-        return results
+        # Played tracks are wrapped with when they were played, such as
+        # {'played_at': ..., 'track': {...}}
+        return [Track(self._session, elem['track'])
+                for elem in response_json['items']]
 
 
     def get_playlists(self, limit=const.MAX_PLAYLISTS):
@@ -427,8 +427,7 @@ class User:
         To get only playlists this user follows, use get_following(sp.PLAYLISTS)
         """
         # Validate inputs
-        if limit <= 0 or limit > const.MAX_PLAYLISTS:
-            raise ValueError(limit)
+        _validate_limit(limit, const.MAX_PLAYLISTS)
 
         endpoint = Endpoints.USER_PLAYLISTS % self.spotify_id()
 
@@ -498,6 +497,85 @@ class User:
         return Playlist(self._session, response_json)
 
 
+    def _contains_help(self, checks):
+        """ Check elems against Spotify's 'contains' endpoints.
+
+        The checks are sent in batches, which are independent of each other and
+        so are sent concurrently when the Session allows it, including batches
+        from different checks.
+
+        Args:
+            checks: (List[tuple]) an (endpoint, elems, uri_params, batch_size)
+                tuple for each check. uri_params are any uri params besides
+                the ids, and batch_size is the max number of ids Spotify checks
+                per request.
+
+        Returns:
+            List[List[bool]]: for each check, whether each of its elems is
+            contained, in order.
+        """
+        def check(batch):
+            endpoint, uri_params, ids = batch
+            response_json, status_code = utils.request(
+                self._session,
+                request_type=const.REQUEST_GET,
+                endpoint=endpoint,
+                body=None,
+                uri_params=dict(uri_params, ids=','.join(ids))
+            )
+
+            if status_code != 200:
+                raise utils.SpotifyError(status_code, response_json)
+
+            return response_json
+
+        # Remember which check each batch belongs to, to split the results
+        batches = []
+        owners = []
+        for i, (endpoint, elems, uri_params, batch_size) in enumerate(checks):
+            for ids in utils.create_batches(utils.map_ids(elems), batch_size):
+                batches.append((endpoint, uri_params, ids))
+                owners.append(i)
+
+        results = [[] for _ in checks]
+        for owner, result in zip(owners,
+                                 utils.concurrent_map(self._session,
+                                                      check,
+                                                      batches)):
+            results[owner].extend(result)
+        return results
+
+
+    def _modify_help(self, request_type, changes):
+        """ Send the requests that modify the user's library or follows.
+
+        The requests are independent of each other and so are sent concurrently
+        when the Session allows it.
+
+        Args:
+            request_type: the request type of every request.
+            changes: (List[tuple]) an (endpoint, uri_params, success code)
+                tuple for each request.
+
+        Raises:
+            SpotifyError: if any request fails.
+        """
+        def send(change):
+            endpoint, uri_params, success = change
+            response_json, status_code = utils.request(
+                self._session,
+                request_type=request_type,
+                endpoint=endpoint,
+                body=None,
+                uri_params=uri_params
+            )
+
+            if status_code != success:
+                raise utils.SpotifyError(status_code, response_json)
+
+        utils.concurrent_map(self._session, send, changes)
+
+
     # TODO: checking return of tuple funcs means ret[0][1] for 1 elem...
     def is_following(self, other):
         """ Check if the current user is following something.
@@ -528,50 +606,25 @@ class User:
         if not isinstance(other, list):
             other = [other]
 
-        for elem in other:
-            if type(elem) not in [Artist, User, Playlist]:
-                raise TypeError(elem)
-
         # Split up input
-        artists = utils.separate(other, Artist)
-        users = utils.separate(other, User)
-        playlists = utils.separate(other, Playlist)
+        artists, users, playlists = utils.separate(other,
+                                                   [Artist, User, Playlist])
 
         # Get boolean values for whether the user follows each in 'other'
         endpoint = Endpoints.USER_FOLLOWING_CONTAINS
-        artist_bools = []
-        for batch in utils.create_batches(utils.map_ids(artists)):
-            response_json, status_code = utils.request(
-                self._session,
-                request_type=const.REQUEST_GET,
-                endpoint=endpoint,
-                body=None,
-                uri_params={'type': 'artist', 'ids': batch}
-            )
-
-            if status_code != 200:
-                raise utils.SpotifyError(status_code, response_json)
-
-            artist_bools.append(response_json)
-
-        user_bools = []
-        for batch in utils.create_batches(utils.map_ids(users)):
-            response_json, status_code = utils.request(
-                self._session,
-                request_type=const.REQUEST_GET,
-                endpoint=endpoint,
-                body=None,
-                uri_params={'type': 'user', 'ids': batch}
-            )
-
-            if status_code != 200:
-                raise utils.SpotifyError(status_code, response_json)
-
-            user_bools.append(response_json)
-
-        # For each playlist in other, check if in the User's followed playlists
-        followed_playlists = self.get_following(const.PLAYLISTS)
-        playlist_bools = list(map(lambda p: p in followed_playlists, playlists))
+        artist_bools, user_bools = self._contains_help([
+            (endpoint, artists, {'type': 'artist'}, const.SPOTIFY_PAGE_SIZE),
+            (endpoint, users, {'type': 'user'}, const.SPOTIFY_PAGE_SIZE),
+        ])
+
+        # For each playlist in other, check if in the User's followed playlists.
+        # Only fetch them if needed, and check against a set of their ids.
+        playlist_bools = []
+        if playlists:
+            followed_ids = {followed.spotify_id() \
+                            for followed in self.get_following(const.PLAYLISTS)}
+            playlist_bools = [playlist.spotify_id() in followed_ids \
+                              for playlist in playlists]
 
         # Zip output with input to make tuples
         artists = list(zip(artists, artist_bools))
@@ -619,44 +672,32 @@ class User:
         if follow_type not in [const.ARTISTS, const.PLAYLISTS]:
             raise TypeError(follow_type)
 
-        # Validate limit
-        if limit is not None:
-            if limit <= 0:
-                raise ValueError(limit)
-            if follow_type == const.PLAYLISTS and limit > const.MAX_PLAYLISTS:
-                raise ValueError(limit)
-
-        # Set limit if not set
-        elif follow_type == const.ARTISTS:
-            limit = sys.maxsize
-        else:
-            limit = const.MAX_PLAYLISTS
+        # Validate limit, and default to the max
+        max_limit = sys.maxsize if follow_type == const.ARTISTS \
+            else const.MAX_PLAYLISTS
+        if limit is None:
+            limit = max_limit
+        _validate_limit(limit, max_limit)
 
         # Deal with followed playlists
         if follow_type == const.PLAYLISTS:
-            results = self.get_playlists()
-
-            def filter_func(playlist):
-                return playlist.owner().spotify_id() != self.spotify_id()
-            results = list(filter(filter_func, results))
+            user_id = self.spotify_id()
+            results = [playlist for playlist in self.get_playlists()
+                       if playlist.owner().spotify_id() != user_id]
 
             return results[:limit]
 
         # Deal with followed artists assert(follow_type == const.ARTISTS)
-        uri_params = {
-            'type': 'artist',
-            'limit': const.SPOTIFY_PAGE_SIZE
-        }
+        # This endpoint pages with a cursor instead of an offset: each page
+        # gives the 'after' value that gets the next page.
+        uri_params = {'type': 'artist'}
         results = []
 
-        # Loop until we get 'limit' many items or run out
-        # Can't use _paginate_get because artist endpoint does it differently...
+        # Loop until we get 'limit' many items or run out. Only ask for as
+        # many artists as are still needed.
         while len(results) < limit:
-
-            # Paginate
-            if len(results) != 0:
-                uri_params['after'] = results[-1].spotify_id()
-
+            uri_params['limit'] = min(const.SPOTIFY_PAGE_SIZE,
+                                      limit - len(results))
             response_json, status_code = utils.request(
                 self._session,
                 request_type=const.REQUEST_GET,
@@ -668,14 +709,18 @@ class User:
             if status_code != 200:
                 raise utils.SpotifyError(status_code, response_json)
 
+            artists = response_json['artists']
+            results.extend(Artist(self._session, elem) \
+                           for elem in artists['items'])
+
             # No more results to grab from spotify
-            if len(response_json['artists']['items']) == 0:
+            after = artists.get('cursors', {}).get('after')
+            if artists.get('next') is None or after is None:
                 break
 
-            for elem in response_json['artists']['items']:
-                results.append(Artist(self._session, elem))
+            uri_params = dict(uri_params, after=after)
 
-        return results[:limit] if limit is not None else results
+        return results[:limit]
 
 
     def _follow_unfollow_help(self, other, request_type):
@@ -687,51 +732,36 @@ class User:
         if not isinstance(other, list):
             other = [other]
 
-        for elem in other:
-            if type(elem) not in [Artist, User, Playlist]:
-                raise TypeError(elem)
-
         # Split up input
-        artists = utils.separate(other, Artist)
-        users = utils.separate(other, User)
-        playlists = utils. separate(other, Playlist)
-
-        for batch in utils.create_batches(utils.map_ids(artists)):
-            response_json, status_code = utils.request(
+        artists, users, playlists = utils.separate(other,
+                                                   [Artist, User, Playlist])
+
+        changes = [
+            (Endpoints.USER_FOLLOW_ARTIST_USER,
+             {'type': 'artist', 'ids': ','.join(batch)},
+             204)
+            for batch in utils.create_batches(utils.map_ids(artists))
+        ]
+        changes += [
+            (Endpoints.USER_FOLLOW_ARTIST_USER,
+             {'type': 'user', 'ids': ','.join(batch)},
+             204)
+            for batch in utils.create_batches(utils.map_ids(users))
+        ]
+        changes += [
+            (Endpoints.USER_FOLLOW_PLAYLIST % playlist.spotify_id(), None, 200)
+            for playlist in playlists
+        ]
+
+        self._modify_help(request_type, changes)
+
+        # Followed playlists are listed with the user's playlists
+        if playlists:
+            utils.invalidate_cache(
                 self._session,
-                request_type=request_type,
-                endpoint=Endpoints.USER_FOLLOW_ARTIST_USER,
-                body=None,
-                uri_params={'type': 'artist', 'ids': batch}
+                Endpoints.USER_PLAYLISTS % self.spotify_id()
             )
 
-            if status_code != 204:
-                raise utils.SpotifyError(status_code, response_json)
-
-        for batch in utils.create_batches(utils.map_ids(users)):
-            response_json, status_code = utils.request(
-                self._session,
-                request_type=request_type,
-                endpoint=Endpoints.USER_FOLLOW_ARTIST_USER,
-                body=None,
-                uri_params={'type': 'user', 'ids': batch}
-            )
-
-            if status_code != 204:
-                raise utils.SpotifyError(status_code, response_json)
-
-        for playlist in playlists:
-            response_json, status_code = utils.request(
-                self._session,
-                request_type=request_type,
-                endpoint=Endpoints.USER_FOLLOW_PLAYLIST % playlist,
-                body=None,
-                uri_params=None
-            )
-
-            if status_code != 200:
-                raise utils.SpotifyError(status_code, response_json)
-
     def follow(self, other):
         """ Follow one or more things.
 
@@ -816,46 +846,17 @@ class User:
         if not isinstance(other, list):
             other = [other]
 
-        for elem in other:
-            if type(elem) not in [Track, Album]:
-                raise TypeError(elem)
-
         # Split up input
-        tracks = utils.separate(other, Track)
-        albums = utils.separate(other, Album)
+        tracks, albums = utils.separate(other, [Track, Album])
 
         # Get boolean values for whether the user has each item saved
         endpoint = Endpoints.USER_HAS_SAVED
 
-        track_bools = []
-        for batch in utils.create_batches(utils.map_ids(tracks)):
-            response_json, status_code = utils.request(
-                self._session,
-                request_type=const.REQUEST_GET,
-                endpoint=endpoint % 'tracks',
-                body=None,
-                uri_params={'ids': batch}
-            )
-
-            if status_code != 200:
-                raise utils.SpotifyError(status_code, response_json)
-
-            track_bools.append(response_json)
-
-        album_bools = []
-        for batch in utils.create_batches(utils.map_ids(albums)):
-            response_json, status_code = utils.request(
-                self._session,
-                request_type=const.REQUEST_GET,
-                endpoint=endpoint % 'albums',
-                body=None,
-                uri_params={'ids': batch}
-            )
-
-            if status_code != 200:
-                raise utils.SpotifyError(status_code, response_json)
-
-            album_bools.append(response_json)
+        # Spotify checks at most 20 albums per request
+        track_bools, album_bools = self._contains_help([
+            (endpoint % 'tracks', tracks, {}, const.SPOTIFY_PAGE_SIZE),
+            (endpoint % 'albums', albums, {}, 20),
+        ])
 
         # Zip output with input to make tuples
         zipped_tracks = list(zip(tracks, track_bools))
@@ -896,18 +897,15 @@ class User:
 
         """
         # Validate inputs
-        if saved_type not in [const.ALBUMS, const.TRACKS]:
+        if saved_type not in _SAVED_TYPES:
             raise TypeError(saved_type)
 
         if limit is None: # Lists can't be longer than sys.maxsize in python
             limit = sys.maxsize
-
-        if limit <= 0:
-            raise ValueError(limit)
+        _validate_limit(limit)
 
         # Make request
-        endpoint_type = 'albums' if saved_type == const.ALBUMS else 'tracks'
-        return_class = Album if saved_type == const.ALBUMS else Track
+        endpoint_type, return_class, item_key = _SAVED_TYPES[saved_type]
         uri_params = {'market': market}
 
         return utils.paginate_get(
@@ -916,7 +914,8 @@ class User:
                         return_class=return_class,
                         endpoint=Endpoints.USER_SAVED % endpoint_type,
                         uri_params=uri_params,
-                        body=None)
+                        body=None,
+                        item_key=item_key)
 
 
     def _save_remove_help(self, other, request_type):
@@ -929,39 +928,23 @@ class User:
         if not isinstance(other, list):
             other = [other]
 
-        for elem in other:
-            if type(elem) not in [Album, Track]:
-                raise TypeError(elem)
-
         # Split up input
-        albums = utils.separate(other, Album)
-        tracks = utils.separate(other, Track)
+        albums, tracks = utils.separate(other, [Album, Track])
 
-        for batch in utils.create_batches(utils.map_ids(albums)):
-            response_json, status_code = utils.request(
-                self._session,
-                request_type=request_type,
-                endpoint=Endpoints.USER_SAVE_ALBUMS,
-                body=None,
-                uri_params={'ids': batch}
-            )
+        # All success codes are 200, except saving an album
+        album_success = 201 if request_type == const.REQUEST_PUT else 200
+        changes = [
+            (Endpoints.USER_SAVE_ALBUMS,
+             {'ids': ','.join(batch)},
+             album_success)
+            for batch in utils.create_batches(utils.map_ids(albums))
+        ]
+        changes += [
+            (Endpoints.USER_SAVE_TRACKS, {'ids': ','.join(batch)}, 200)
+            for batch in utils.create_batches(utils.map_ids(tracks))
+        ]
 
-            # All success codes are 200, except saving an album
-            success = 201 if request_type == const.REQUEST_PUT else 200
-            if status_code != success:
-                raise utils.SpotifyError(status_code, response_json)
-
-        for batch in utils.create_batches(utils.map_ids(tracks)):
-            response_json, status_code = utils.request(
-                self._session,
-                request_type=request_type,
-                endpoint=Endpoints.USER_SAVE_TRACKS,
-                body=None,
-                uri_params={'ids': batch}
-            )
-
-            if status_code != 200:
-                raise utils.SpotifyError(status_code, response_json)
+        self._modify_help(request_type, changes)
 
 
     def save(self, other):
@@ -1015,3 +998,24 @@ from spotifython.artist import Artist
 from spotifython.player import Player
 from spotifython.playlist import Playlist
 from spotifython.track import Track
+
+# Spotify's name for each time range accepted by User.top
+_TIME_RANGES = {
+    const.LONG: 'long_term',
+    const.MEDIUM: 'medium_term',
+    const.SHORT: 'short_term',
+}
+
+# The endpoint type and class of each item type accepted by User.top
+_TOP_TYPES = {
+    const.ARTISTS: ('artists', Artist),
+    const.TRACKS: ('tracks', Track),
+}
+
+# The endpoint type, class and item key of each item type accepted by
+# User.get_saved. Saved objects are wrapped with the time they were added,
+# such as {'added_at': ..., 'track': {...}}
+_SAVED_TYPES = {
+    const.ALBUMS: ('albums', Album, 'album'),
+    const.TRACKS: ('tracks', Track, 'track'),
+}
@@ -1,18 +1,30 @@
 """ Helper methods for spotifython. These shouldn't be used by the client. """
 
 # Standard library imports
-import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import json
+import random
+import sys
+import threading
 import time
 
 # Third party imports
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 # Known pylint problem with certain libraries, this import should work.
 # See: https://github.com/PyCQA/pylint/issues/2603
 #pylint: disable=import-error
 from requests.packages.urllib3.util.retry import Retry
 
+# Optional third party imports. orjson parses and serializes json several times
+# faster than the standard library, so it is used when installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Local imports
 import spotifython.constants as const
 from spotifython.endpoints import Endpoints
@@ -53,14 +65,13 @@ def get_field(obj, field):
     # TODO: add type checking for obj after we figure out the circular
     # dependency problem out.
 
-    if not isinstance(field, str):
-        raise TypeError(field)
-
-    if field not in obj._raw:
+    # Accessors call this on every read, so a present field only costs one
+    # lookup. update_and_get_field checks the type of field on a miss.
+    try:
+        return obj._raw[field]
+    except KeyError:
         return update_and_get_field(obj, field)
 
-    return obj._raw.get(field)
-
 def update_and_get_field(obj, field):
     """ Updates the field if not present in the Spotify object.
 
@@ -91,6 +102,418 @@ def update_and_get_field(obj, field):
 # HTTP REQUESTS
 ##################################
 
+def json_loads(data):
+    """ Parse the json in data, a str or bytes.
+
+    Raises:
+        ValueError: if data is not valid json, including if it is empty.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """ Serialize obj to json.
+
+    Returns:
+        bytes: the utf-8 encoded json.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def create_http_session(max_workers=const.DEFAULT_MAX_WORKERS):
+    """ Create the HTTP session used to send all of a Session's requests.
+
+    The returned requests.Session keeps connections to Spotify alive between
+    calls and retries failed requests with exponential backoff.
+
+    Args:
+        max_workers: (int) the max number of requests the Session sends at
+            once. The connection pool keeps at least this many connections, so
+            concurrent requests don't discard connections on return.
+
+    Returns:
+        requests.Session: the configured HTTP session.
+    """
+    # total: max number of retries
+    # backoff_factor: for exponential backoff. will wait 0.5,1,2,4,8,16,32 etc.
+    # with total = 7 and backoff = 1, will wait 32 sec for last retry, 64 total
+    # status_forcelist: transient Spotify errors are retried as well
+    # raise_on_status: return the last response so request() can raise the
+    #   appropriate error for it
+    # respect_retry_after_header: 429s are handled by request() instead, since
+    #   urllib3 only retries them for idempotent requests
+    retry_strategy = Retry(total=7,
+                           backoff_factor=1,
+                           status_forcelist=[500, 502, 503, 504],
+                           raise_on_status=False,
+                           respect_retry_after_header=False)
+
+    # Apply the retry strategy
+    adapter = HTTPAdapter(max_retries=retry_strategy,
+                          pool_maxsize=max(DEFAULT_POOLSIZE, max_workers))
+    http = requests.Session()
+    http.mount('https://', adapter)
+    http.mount('http://', adapter)
+
+    # Headers shared by every request. The Session adds the Authorization
+    # header, and replaces it when it is reauthenticated. requests already sends
+    # 'Accept-Encoding: gzip, deflate' and decodes compressed responses, so
+    # Spotify's json is compressed on the wire without anything set here.
+    http.headers.update({
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    })
+
+    return http
+
+class RateLimiter:
+    #pylint: disable=too-few-public-methods
+    """ Token bucket that limits how many requests a Session sends per second.
+
+    The bucket holds up to 'rate' tokens and refills at 'rate' tokens per
+    second. Each request takes a token, waiting for one if the bucket is empty,
+    so bursts of requests are spread out before Spotify has to rate limit them.
+    When Spotify does rate limit a request, the whole bucket can be paused, so
+    that concurrent requests wait too instead of each being rate limited.
+    Safe to share between threads.
+    """
+
+    def __init__(self, rate):
+        """ Create a full bucket.
+
+        Args:
+            rate: (int, float) the max average number of requests per second.
+        """
+        self._rate = rate
+        self._capacity = max(rate, 1)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """ Take a token, blocking until one is available. """
+        with self._lock:
+            # The bucket doesn't refill while paused, when _last_refill is in
+            # the future
+            now = time.monotonic()
+            if now > self._last_refill:
+                elapsed = now - self._last_refill
+                self._tokens = min(self._capacity,
+                                   self._tokens + elapsed * self._rate)
+                self._last_refill = now
+
+            # Reserve the token now and sleep outside the lock; a negative
+            # balance makes later callers wait their turn behind this one.
+            self._tokens -= 1
+            wait = self._last_refill - now
+            if self._tokens < 0:
+                wait += -self._tokens / self._rate
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """ Hold back all requests for 'seconds', such as a 429's Retry-After.
+
+        Once the pause ends, requests are let through one at a time at the
+        rate, rather than in a burst that Spotify would rate limit again.
+        """
+        with self._lock:
+            resume = time.monotonic() + seconds
+            if resume > self._last_refill:
+                self._last_refill = resume
+                self._tokens = min(self._tokens, 1)
+
+def cache_directives(headers):
+    """ Get the lowercase Cache-Control directives of a response. """
+    return [directive.strip().lower()
+            for directive in headers.get('Cache-Control', '').split(',')]
+
+
+def cache_max_age(headers):
+    """ Get how long a response may be reused for, from its Cache-Control.
+
+    Args:
+        headers: the response headers.
+
+    Returns:
+        The max-age of the response in seconds, or 0 if it must not be reused
+        without asking Spotify.
+    """
+    directives = cache_directives(headers)
+
+    if 'no-store' in directives or 'no-cache' in directives:
+        return 0
+
+    for directive in directives:
+        if directive.startswith('max-age='):
+            try:
+                return max(int(directive[len('max-age='):]), 0)
+            except ValueError:
+                return 0
+
+    return 0
+
+
+class ResponseCache:
+    """ LRU cache of the JSON from successful GET requests.
+
+    Responses are reused without a request for as long as Spotify's
+    Cache-Control header allows, so repeating a query (such as Artist.albums()
+    with a smaller limit) within that window is free. After that, responses
+    with an ETag or Last-Modified header are revalidated with a conditional
+    request, and a 304 from Spotify reuses the cached JSON. Safe to share
+    between threads.
+
+    Note: the cached JSON is returned to every caller that asks for it, so it
+    must not be modified.
+    """
+
+    def __init__(self, max_size):
+        """ Create an empty cache.
+
+        Args:
+            max_size: (int) the max number of responses to keep.
+        """
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint, uri_params):
+        """ Get the cache key for a GET request. """
+        if not uri_params:
+            return endpoint, ()
+
+        params = sorted((key, str(val)) for key, val in uri_params.items())
+        return endpoint, tuple(params)
+
+    def lookup(self, key):
+        """ Get the cached response for key.
+
+        Returns:
+            None if nothing is cached for key. Otherwise a tuple
+            (content, is_fresh, validators), where validators are the
+            headers that make the request conditional on the content having
+            changed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(key)
+
+        content, expires, validators = entry
+        return content, time.monotonic() < expires, validators
+
+    def put(self, key, content, headers):
+        """ Cache content for key, if its response headers allow it.
+
+        Args:
+            key: the key from ResponseCache.key().
+            content: the response JSON.
+            headers: the headers of the response content came from. For a 304,
+                these may leave out validators that are still current.
+        """
+        if 'no-store' in cache_directives(headers):
+            return
+
+        validators = {}
+        if 'ETag' in headers:
+            validators['If-None-Match'] = headers['ETag']
+        if 'Last-Modified' in headers:
+            validators['If-Modified-Since'] = headers['Last-Modified']
+
+        max_age = cache_max_age(headers)
+
+        with self._lock:
+            # A 304 doesn't have to repeat the validators it confirmed
+            if not validators and key in self._entries:
+                validators = self._entries[key][2]
+
+            # Nothing to reuse or revalidate with
+            if max_age == 0 and not validators:
+                self._entries.pop(key, None)
+                return
+
+            self._entries[key] = (content,
+                                  time.monotonic() + max_age,
+                                  validators)
+            self._entries.move_to_end(key)
+
+            # Evict the least recently used responses
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint):
+        """ Remove the cached responses for endpoint, the endpoints under it
+        and the endpoints above it.
+
+        For example, invalidating 'playlists/{id}' also removes the cached
+        responses for 'playlists/{id}/tracks'. Invalidating
+        'playlists/{id}/tracks' also removes 'playlists/{id}', since the
+        playlist's response includes its tracks.
+
+        Args:
+            endpoint: the endpoint that was modified.
+        """
+        prefix = endpoint + '/'
+        parts = endpoint.split('/')
+        ancestors = {'/'.join(parts[:i]) for i in range(1, len(parts))}
+        with self._lock:
+            stale_keys = [key for key in self._entries
+                          if key[0] == endpoint or
+                          key[0] in ancestors or
+                          key[0].startswith(prefix)]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self):
+        """ Remove all cached responses. """
+        with self._lock:
+            self._entries.clear()
+
+# Max number of times a rate limited (429) request is retried
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Bounds in seconds for the exponential backoff used when Spotify rate limits a
+# request without saying how long to wait.
+BACKOFF_BASE = 1
+BACKOFF_CAP = 32
+
+def rate_limit_delay(response, attempt):
+    """ Get how long to wait before retrying a rate limited request.
+
+    Args:
+        response: the requests.Response with status code 429.
+        attempt: (int) how many times the request has been retried so far.
+
+    Returns:
+        The number of seconds to wait. This is the Retry-After header if
+        Spotify sent one, and capped exponential backoff with jitter otherwise.
+    """
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        backoff = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)
+        return backoff + random.uniform(0, BACKOFF_BASE)
+
+def _send(session, request_type, request_uri, **kwargs):
+    """ Send a request, resending it while Spotify rate limits it (429).
+
+    Args:
+        session: the Session sending the request.
+        request_type: the HTTP verb.
+        request_uri: the full uri to request.
+        kwargs: passed on to requests.Session.request().
+
+    Returns:
+        requests.Response: the response to the last attempt.
+    """
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        if session._rate_limiter is not None:
+            session._rate_limiter.acquire()
+
+        # Reuse the Session's pooled connections so each call skips the TCP /
+        # TLS handshake with Spotify.
+        response = session._http.request(request_type,
+                                         request_uri,
+                                         timeout=session.timeout(),
+                                         **kwargs)
+
+        # 429: rate limiting applied. Spotify didn't process the request, so it
+        # is safe to resend no matter the request type.
+        if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+            break
+
+        # With a rate limiter, the wait applies to every request the Session
+        # sends, and acquire() waits it out before the retry.
+        delay = rate_limit_delay(response, attempt)
+        if session._rate_limiter is not None:
+            session._rate_limiter.pause(delay)
+        else:
+            time.sleep(delay)
+
+    return response
+
+def _cached_response(session, request_type, cache_key, headers):
+    """ Get the Session's cached response for a request.
+
+    If the cached response is stale, its validators are added to headers so
+    that Spotify only sends the content again if it changed.
+
+    Args:
+        session: the Session making the request.
+        request_type: the HTTP verb. Only GETs are cached.
+        cache_key: the key from ResponseCache.key().
+        headers: (dict) the headers of the request.
+
+    Returns:
+        A tuple (content, is_fresh). content is None if nothing is cached.
+    """
+    if request_type != const.REQUEST_GET or session._cache is None:
+        return None, False
+
+    cached = session._cache.lookup(cache_key)
+    if cached is None:
+        return None, False
+
+    content, is_fresh, validators = cached
+    if not is_fresh:
+        headers.update(validators)
+
+    return content, is_fresh
+
+def _store_response(session, request_type, cache_key, content, response):
+    """ Update the Session's cache after a request.
+
+    Successful GETs are cached, and successful writes remove the cached
+    responses that they made stale.
+
+    Args:
+        session: the Session that made the request.
+        request_type: the HTTP verb.
+        cache_key: the key from ResponseCache.key().
+        content: the response JSON. For a 304, the cached JSON it confirmed.
+        response: the requests.Response.
+    """
+    cache = session._cache
+    if cache is None:
+        return
+
+    status_code = response.status_code
+    if request_type == const.REQUEST_GET:
+        if status_code in [200, 304] and content is not None:
+            cache.put(cache_key, content, response.headers)
+    elif status_code in [200, 201, 202, 204]:
+        cache.invalidate(cache_key[0])
+
+def invalidate_cache(session, endpoint):
+    """ Remove the cached responses that a change to endpoint made stale.
+
+    Writes already invalidate the endpoint they were sent to. Use this for
+    responses that a write changes under a different endpoint.
+
+    Args:
+        session: the Session whose cache to update.
+        endpoint: the endpoint whose responses are stale.
+    """
+    if session._cache is not None:
+        session._cache.invalidate(endpoint)
+
+# HTTP verbs accepted by request()
+REQUEST_TYPES = frozenset([
+    const.REQUEST_GET,
+    const.REQUEST_POST,
+    const.REQUEST_PUT,
+    const.REQUEST_DELETE
+])
+
 def request(session,
             request_type,
             endpoint,
@@ -107,54 +530,65 @@ def request(session,
         request_type: one of sp.REQUEST_GET, sp.REQUEST_POST, sp.REQUEST_PUT,
             sp.REQUEST_DELETE.
         endpoint: the Spotify uri to request
-        body: (dict) the body to send as part of the request
+        body: (dict) the body to send as part of the request, encoded as
+            json. (bytes) a base64 encoded JPEG image to send as is.
         uri_params: (dict) the params to encode in the uri
 
     Returns:
         The response JSON and status code from Spotify. If the response contains
         invalid JSON or no content, response_json=None.
 
+    Note:
+        Requests that Spotify rate limits (429) are retried after the delay
+        given in the Retry-After header, up to MAX_RATE_LIMIT_RETRIES times.
+
+        GET responses are served from the Session's cache while their
+        Cache-Control max-age allows it, and revalidated with Spotify using
+        their ETag / Last-Modified headers after that. A successful POST, PUT
+        or DELETE removes the cached responses for its endpoint.
+
     Exceptions:
+        Raises a ValueError if request_type is not one of the above.
         Raises an HTTPError object in the event of an unsuccessful web request.
         All exceptions are as according to requests.Request.
     """
-    request_uri = Endpoints.BASE_URI + endpoint
-    headers = {
-        'Authorization': 'Bearer ' + session.token(),
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
-
-    # total: max number of retries
-    # backoff_factor: for exponential backoff. will wait 0.5,1,2,4,8,16,32 etc.
-    # with total = 7 and backoff = 1, will wait 32 sec for last retry, 64 total
-    retry_strategy = Retry(total=7, backoff_factor=1)
-
-    # Apply the retry strategy
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    http = requests.Session()
-    http.mount('https://', adapter)
-    http.mount('http://', adapter)
-
-    while True:
-        response = http.request(request_type,
-                                request_uri,
-                                json=body,
-                                params=uri_params,
-                                headers=headers,
-                                timeout=session.timeout())
-
-        status_code = response.status_code
-
-        # 429: rate limiting applied
-        if status_code == 429:
-            time.sleep(response.headers['Retry-After'])
-        else:
-            break
+    # Fail before doing any work for the request
+    if request_type not in REQUEST_TYPES:
+        raise ValueError(f'Invalid request type <{request_type}>')
+
+    # Only headers specific to this request. The rest are set on the Session's
+    # HTTP session once.
+    headers = {}
+
+    # Serve repeated GETs from the cache while Spotify says they are fresh, and
+    # otherwise only ask for the content if it has changed.
+    cache_key = ResponseCache.key(endpoint, uri_params)
+    cached_content, is_fresh = _cached_response(session,
+                                                request_type,
+                                                cache_key,
+                                                headers)
+    if is_fresh:
+        return cached_content, 200
+
+    # The Session's headers already declare the body as json. The only raw
+    # body Spotify accepts is a base64 encoded JPEG.
+    if isinstance(body, bytes):
+        data = body
+        headers['Content-Type'] = 'image/jpeg'
+    else:
+        data = None if body is None else json_dumps(body)
+
+    response = _send(session,
+                     request_type,
+                     Endpoints.BASE_URI + endpoint,
+                     data=data,
+                     params=uri_params,
+                     headers=headers)
+    status_code = response.status_code
 
     # ValueError if no content; not an error
     try:
-        content = response.json()
+        content = json_loads(response.content)
     except ValueError:
         content = None
 
@@ -176,6 +610,12 @@ def request(session,
     if status_code in [500, 502, 503]:
         raise SpotifyError('%d, %s' % (status_code, message))
 
+    # 304: the cached content is still current
+    if cached_content is not None and status_code == 304:
+        content, status_code = cached_content, 200
+
+    _store_response(session, request_type, cache_key, content, response)
+
     # Success codes, 403 (forbidden), 404 (not found)
     # Our functions should case on 403/404 and deal with them accordingly.
     if status_code in [200, 201, 202, 204, 304, 403, 404]:
@@ -192,8 +632,10 @@ def paginate_get(session,
                  endpoint,
                  uri_params=None,
                  body=None,
-                 page_size=const.SPOTIFY_PAGE_SIZE):
-    #pylint: disable=too-many-arguments
+                 page_size=const.SPOTIFY_PAGE_SIZE,
+                 start=0,
+                 item_key=None):
+    #pylint: disable=too-many-arguments, too-many-locals
     """ Used to get a large number of objects from Spotify.
 
     Note: does a GET request
@@ -214,48 +656,61 @@ def paginate_get(session,
             Return json must contain key 'items'.
         uri_params: (dict) the uri parameters for the request.
         body: (dict) the body of the call.
+        page_size: (int) the number of items to request per call. Must be at
+            most the endpoint's max 'limit'.
+        start: (int) the offset of the first item to return.
+        item_key: (str) if not None, each item wraps the object to construct
+            under this key, such as 'track' for the items of a playlist. Items
+            whose object is null, such as removed or unavailable tracks, are
+            skipped.
 
     Returns:
         A list of objects of type return_class
     """
-    # Init params
+    # Init params. The limit is the same for every page, so only the offset
+    # needs to be set per page.
     uri_params = dict() if uri_params is None else uri_params
+    uri_params = dict(uri_params, limit=page_size)
     body = dict() if body is None else body
 
-    # Execute requests
-    results = []
-
-    uri_params['limit'] = page_size
-
-    # Loop until we get 'limit' many items or run out. If there is no limit,
-    # keep going until we run out of items.
-    next_multiple = lambda num, mult: math.ceil(num / mult) * mult
-    num_to_request = next_multiple(limit, page_size) if limit is not None \
-        else float('inf')
-    offset = 0
+    def get_page(offset):
+        """ Get the page of results starting at 'offset'.
 
-    while num_to_request > 0:
-        uri_params['offset'] = offset
+        Returns:
+            A tuple of the total number of items and the objects in the page.
+        """
+        # Each page gets its own params since pages may be requested at once
+        page_params = dict(uri_params, offset=offset)
         response_json, status_code = request(
             session,
             request_type=const.REQUEST_GET,
             endpoint=endpoint,
             body=body,
-            uri_params=uri_params
+            uri_params=page_params
         )
 
         if status_code != 200:
-            raise Exception('Oh no TODO!')
-
-        # No more results to grab from spotify
-        if len(response_json['items']) == 0:
-            break
-
-        for elem in response_json['items']:
-            results.append(return_class(session, elem))
-
-        num_to_request -= 1
-        offset += page_size
+            raise SpotifyError(status_code, response_json)
+
+        # Build the objects as soon as the page arrives, so the page's json is
+        # released right away instead of once every page has been fetched.
+        items = response_json['items']
+        if item_key is not None:
+            items = [item[item_key] for item in items
+                     if item[item_key] is not None]
+        return response_json['total'], \
+               [return_class(session, item) for item in items]
+
+    # The first page tells us how many items there are in total, so the offsets
+    # of every remaining page are known up front and can be fetched together.
+    total, results = get_page(start)
+    end = total if limit is None else min(start + limit, total)
+    pages = concurrent_map(session,
+                           get_page,
+                           range(start + page_size, end, page_size))
+
+    for _, page in pages:
+        results.extend(page)
 
     return results[:limit]
 
@@ -263,23 +718,90 @@ def paginate_get(session,
 # HELPERS
 ##################################
 
+def concurrent_map(session, func, elems):
+    """ Call func on each element of elems, running up to
+    session.max_workers() calls at once.
+
+    Args:
+        session: the Session the calls are made for. If None, the calls are
+            made one at a time.
+        func: a function that takes a single element of elems.
+        elems: the elements to call func on.
+
+    Returns:
+        A list of the results of func, in the same order as elems. If any call
+        raises an exception, it is re-raised here.
+    """
+    elems = list(elems)
+    max_workers = 1 if session is None else session.max_workers()
+
+    if max_workers == 1 or len(elems) <= 1:
+        return [func(elem) for elem in elems]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(elems))) as pool:
+        return list(pool.map(func, elems))
+
+
 def create_batches(elems, batch_size=const.SPOTIFY_PAGE_SIZE):
     """ Break list into batches of max len 'batch_size'.
 
+    The batches are generated lazily, so requests for the first batches can be
+    sent before the later ones are sliced.
+
     Args:
         elems: the list of elements to split
         batch_size: the max len of the output batches
 
     Ex:
         >>> elems = [1, 2, 3, 4, 5, 6, 7]
-        >>> create_batches(elems, batch_size=2)
+        >>> list(create_batches(elems, batch_size=2))
         >>> [[1,2], [3,4], [5,6], [7]]
     """
-    results = []
     for i in range(0, len(elems), batch_size):
-        results += [elems[i:i + batch_size]]
+        yield elems[i:i + batch_size]
 
-    return results
+
+def intern_markets(raw):
+    """ Make the available markets of a Spotify object share their strings.
+
+    Tracks and albums each list up to ~180 two letter market codes, mostly the
+    same ones. Interning them keeps one string per market in memory, instead of
+    one per market per object, which adds up over a large library.
+
+    Args:
+        raw: (dict) the object's own copy of its info. Modified in place.
+    """
+    if 'available_markets' in raw:
+        raw['available_markets'] = [sys.intern(market)
+                                    for market in raw['available_markets']]
+
+
+def get_shared(session, cls, info):
+    """ Get an instance of cls for the Spotify object in info, reusing the
+    Session's existing instance for the same object if there is one.
+
+    Tracks in a playlist or library often share their albums and artists, so
+    this saves building (and later fetching) the same object many times.
+
+    Args:
+        session: the Session the object belongs to. If None, nothing is shared.
+        cls: the class to construct, such as Album or Artist. Must allow weak
+            references.
+        info: (dict) the object's information. Must contain 'id'.
+
+    Returns:
+        An instance of cls.
+    """
+    if session is None:
+        return cls(session, info)
+
+    key = (cls, info['id'])
+    shared = session._shared_objects.get(key)
+    if shared is None:
+        shared = cls(session, info)
+        shared = session._shared_objects.setdefault(key, shared)
+
+    return shared
 
 
 def spotifython_eq(self, other):
@@ -302,14 +824,38 @@ def spotifython_hash(obj):
     different calls to User.top, they should have the same hash.
     """
 
-    # Use builtin hash
-    return hash(obj.__class__.__name__ + obj.spotify_id())
+    # Use builtin hash. Hashing a tuple reuses the id's cached hash, instead
+    # of building and hashing a new string on every call.
+    return hash((obj.__class__, obj.spotify_id()))
 
-def separate(elems, filter_type):
-    """ Filter out all objects of type 'filter_type' from elems. """
+def separate(elems, types):
+    """ Split elems by type, in a single pass over elems.
 
-    filter_func = lambda elem: isinstance(elem, filter_type)
-    return list(filter(filter_func, elems))
+    Args:
+        elems: the objects to split.
+        types: the types to split elems into.
+
+    Returns:
+        A list with one list per type in types, holding the elements of elems
+        that are instances of that type, in their original order. An instance
+        of a subclass goes to the first of types that it is an instance of.
+
+    Raises:
+        TypeError: if an element is not an instance of any of types.
+    """
+    buckets = {elem_type: [] for elem_type in types}
+    for elem in elems:
+        bucket = buckets.get(type(elem))
+        if bucket is None:
+            # Only subclasses of types get here, so the exact type lookup
+            # handles almost every element
+            bucket = next((buckets[elem_type] for elem_type in types
+                           if isinstance(elem, elem_type)), None)
+            if bucket is None:
+                raise TypeError(elem)
+        bucket.append(elem)
+
+    return [buckets[elem_type] for elem_type in types]
 
 def map_ids(elems):
     """ Turn a list of objects into a list of spotify ids. """
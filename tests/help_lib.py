@@ -66,3 +66,43 @@ def get_dummy_data(data_type: str,
         result = [map_func(elem) for elem in result]
 
     return result
+
+
+def paged_response(items, total=None, wrap_key=None):
+    """ Helper function for the test suite to mock paginated Spotify endpoints
+
+    Pages may be requested in any order when they are fetched concurrently, so
+    the returned function answers each request based on its offset.
+
+    Args:
+        items: the json objects of every item that can be paged through.
+        total: the total number of items Spotify reports. Default len(items).
+        wrap_key: if not None, each item is wrapped as {wrap_key: item}, the
+                  way playlist tracks and saved objects are returned.
+
+    Returns:
+        A function to use as the side_effect of the utils.request mock.
+    """
+    total = len(items) if total is None else total
+
+    def get_page(*_, **kwargs):
+        offset = kwargs['uri_params']['offset']
+        limit = kwargs['uri_params']['limit']
+        page = items[offset:offset + limit]
+        if wrap_key is not None:
+            page = [{wrap_key: item} for item in page]
+
+        return (
+            {
+                'href': 'href_uri',
+                'items': page,
+                'limit': limit,
+                'next': None if offset + limit >= total else 'next_here',
+                'offset': offset,
+                'previous': 'previous_uri',
+                'total': total,
+            },
+            200
+        )
+
+    return get_page
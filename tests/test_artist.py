@@ -21,7 +21,7 @@ import unittest
 from unittest.mock import patch
 
 # Local imports
-from tests.help_lib import get_dummy_data
+from tests.help_lib import get_dummy_data, paged_response
 import spotifython.constants as const
 import spotifython.utils as utils
 
@@ -117,6 +117,34 @@ class TestArtist(unittest.TestCase):
         # pylint: disable=protected-access
         self.assertEqual(artist._raw.__len__(), expected_artist._raw.__len__())
 
+    # Test that a missing field doesn't refetch a full artist
+    def test_update_fields_once(self):
+        artist_json = get_dummy_data(const.ARTISTS, limit=1)[0]
+        del artist_json['popularity']
+        self.request_mock.return_value = (artist_json, 200)
+        artist = Artist(self.session, {'id': artist_json['id']})
+
+        self.assertEqual(artist.name(), artist_json['name'])
+        self.assertRaises(utils.SpotifyError, artist.popularity)
+        self.assertRaises(utils.SpotifyError, artist.popularity)
+        self.assertEqual(self.request_mock.call_count, 1)
+
+    # Test that a full artist is never refetched
+    def test_update_fields_full(self):
+        artist_json = get_dummy_data(const.ARTISTS, limit=1)[0]
+        del artist_json['uri']
+        artist = Artist(self.session, artist_json)
+        self.assertRaises(utils.SpotifyError, artist.uri)
+        self.request_mock.assert_not_called()
+
+        simplified_json = {
+            key: artist_json[key] for key in ('id', 'name', 'href', 'type')
+        }
+        artist = Artist(self.session, simplified_json)
+        self.request_mock.return_value = (artist_json, 200)
+        self.assertEqual(artist.popularity(), artist_json['popularity'])
+        self.assertEqual(self.request_mock.call_count, 1)
+
     # Test albums()
     def test_albums_with_limit(self):
         search_limit = 100
@@ -224,6 +252,21 @@ class TestArtist(unittest.TestCase):
         albums = artist.albums()
         self.assertEqual(albums, expected_albums)
 
+    def test_albums_concurrent_pages(self):
+        # 3 pages, so the last 2 are requested at the same time
+        total = 150
+        albums_json = get_dummy_data(const.ALBUMS, limit=100)
+        albums_json = (albums_json * 2)[:total]
+        expected_albums = [Album(None, album) for album in albums_json]
+
+        self.request_mock.side_effect = paged_response(albums_json)
+
+        session = Session(TOKEN, max_workers=2)
+        artist = Artist(session, get_dummy_data(const.ARTISTS, limit=1)[0])
+        albums = artist.albums()
+        self.assertEqual(albums, expected_albums)
+        self.assertEqual(self.request_mock.call_count, 3)
+
     # Test top_tracks()
     def test_top_tracks(self):
         self.request_mock.return_value = (
@@ -250,11 +293,35 @@ class TestArtist(unittest.TestCase):
         related_artists = artist.related_artists()
         self.assertEqual(related_artists, expected_artists)
 
+    # Test prefetch()
+    def test_prefetch(self):
+        tracks_json = get_dummy_data(const.TRACKS, limit=10)
+        artists_json = get_dummy_data(const.ARTISTS, limit=20)
+
+        # The requests may be made in any order, so answer based on endpoint
+        def get_response(*_, **kwargs):
+            if kwargs['endpoint'].endswith('/top-tracks'):
+                return ({'tracks': tracks_json}, 200)
+            return ({'artists': artists_json}, 200)
+        self.request_mock.side_effect = get_response
+
+        session = Session(TOKEN, max_workers=2)
+        artist = Artist(session, get_dummy_data(const.ARTISTS, limit=1)[0])
+        artist.prefetch()
+        self.assertEqual(self.request_mock.call_count, 2)
+
+        self.assertEqual(artist.top_tracks(),
+                         get_dummy_data(const.TRACKS, limit=10, to_obj=True))
+        self.assertEqual(artist.related_artists(),
+                         get_dummy_data(const.ARTISTS, limit=20, to_obj=True))
+        self.assertEqual(self.request_mock.call_count, 2)
+
 # This allows the tests to be executed
 if __name__ == '__main__':
     unittest.main()
 
 #pylint: disable=wrong-import-position
 #pylint: disable=wrong-import-order
+from spotifython.album import Album
 from spotifython.artist import Artist
 from spotifython.session import Session
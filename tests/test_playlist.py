@@ -3,11 +3,14 @@
 # pylint: disable=missing-docstring
 
 # Standard library imports
+import base64
+import os
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 # Local imports
-from tests.help_lib import get_dummy_data
+from tests.help_lib import get_dummy_data, paged_response
 import spotifython.constants as const
 import spotifython.utils as utils
 from spotifython.session import Session
@@ -29,9 +32,14 @@ class TestPlaylist(unittest.TestCase):
         self.request_mock = self.patcher.start()
 
 
-    @unittest.skip('Not yet implemented')
     def test_init(self):
-        pass
+        info = get_dummy_data(const.PLAYLISTS, limit=1)[0]
+        playlist = Playlist(self.session, info)
+
+        # The playlist doesn't share info, which may be a cached response
+        # pylint: disable=protected-access
+        self.assertEqual(playlist._raw, info)
+        self.assertIsNot(playlist._raw, info)
 
 
     def test_dunder(self):
@@ -116,9 +124,49 @@ class TestPlaylist(unittest.TestCase):
         pass
 
 
-    @unittest.skip('Not yet implemented')
     def test_add_tracks(self):
-        pass
+        self.request_mock.return_value = ({'snapshot_id': 'snapshot'}, 201)
+        tracks_json = get_dummy_data(const.TRACKS, limit=50)
+        tracks = [Track(None, track) for track in (tracks_json * 5)[:250]]
+        playlist = get_dummy_data(const.PLAYLISTS, limit=1, to_obj=True)[0]
+        # pylint: disable=protected-access
+        playlist._tracks = tracks[:10]
+
+        # Spotify takes at most 100 uris per request
+        playlist.add_tracks(tracks, position=0)
+        bodies = [call[1]['body'] \
+                  for call in self.request_mock.call_args_list]
+        self.assertEqual([len(body['uris']) for body in bodies],
+                         [100, 100, 50])
+        self.assertEqual([body['position'] for body in bodies], [0, 100, 200])
+        self.assertEqual([uri for body in bodies for uri in body['uris']],
+                         [track.uri() for track in tracks])
+
+        # Without a position, the tracks are appended
+        self.request_mock.reset_mock()
+        playlist.add_tracks(tracks[0])
+        self.request_mock.assert_called_once_with(
+            None,
+            request_type='POST',
+            endpoint=f'playlists/{playlist.spotify_id()}/tracks',
+            body={'uris': [tracks[0].uri()]}
+        )
+
+        # Inserting at the end of the playlist is allowed
+        self.request_mock.reset_mock()
+        playlist.add_tracks(tracks[0], position=len(playlist))
+        self.assertEqual(self.request_mock.call_args[1]['body']['position'],
+                         len(playlist))
+        self.assertRaises(ValueError,
+                          playlist.add_tracks,
+                          tracks[0],
+                          position=len(playlist) + 1)
+
+        # Including into an empty playlist
+        self.request_mock.reset_mock()
+        playlist._tracks = []
+        playlist.add_tracks(tracks[0], position=0)
+        self.assertEqual(self.request_mock.call_args[1]['body']['position'], 0)
 
 
     @unittest.skip('Not yet implemented')
@@ -141,14 +189,98 @@ class TestPlaylist(unittest.TestCase):
         pass
 
 
-    @unittest.skip('Not yet implemented')
     def test_tracks(self):
-        pass
+        total = 250
+        start = 50
+        tracks_json = get_dummy_data(const.TRACKS, limit=50)
+        tracks_json = (tracks_json * 5)[:total]
+        expected_tracks = [Track(None, track) for track in tracks_json]
+
+        self.request_mock.side_effect = paged_response(tracks_json,
+                                                       wrap_key='track')
+
+        session = Session(TOKEN, max_workers=2)
+        playlist = Playlist(
+            session,
+            get_dummy_data(const.PLAYLISTS, limit=1)[0]
+        )
+        # pylint: disable=protected-access
+        playlist._tracks = expected_tracks
+
+        tracks = playlist.tracks(start=start)
+        self.assertEqual(tracks, expected_tracks[start:])
+
+        # Pages of 100 tracks, starting at 'start'
+        offsets = sorted(call[1]['uri_params']['offset'] \
+                         for call in self.request_mock.call_args_list)
+        self.assertEqual(offsets, [50, 150])
+
+
+    def test_tracks_null_items(self):
+        # Removed or unavailable tracks come back as null
+        tracks_json = get_dummy_data(const.TRACKS, limit=150)
+        tracks_json[1] = None
+        tracks_json[120] = None
+        expected_tracks = [Track(None, track) for track in tracks_json
+                           if track is not None]
+
+        info = get_dummy_data(const.PLAYLISTS, limit=1)[0]
+        info['tracks'] = dict(info['tracks'],
+                              items=[{'track': track}
+                                     for track in tracks_json[:100]])
+        playlist = Playlist(Session(TOKEN, max_workers=2), info)
+        self.assertEqual(len(playlist), 99)
+
+        # Null items are skipped when paging through the tracks too
+        self.request_mock.side_effect = paged_response(tracks_json,
+                                                       wrap_key='track')
+        self.assertEqual(playlist.tracks(), expected_tracks)
 
 
-    @unittest.skip('Not yet implemented')
     def test_remove_tracks(self):
-        pass
+        self.request_mock.return_value = ({'snapshot_id': 'snapshot'}, 200)
+        tracks = get_dummy_data(const.TRACKS, limit=10, to_obj=True)
+        playlist = get_dummy_data(const.PLAYLISTS, limit=1, to_obj=True)[0]
+        # pylint: disable=protected-access
+        playlist._tracks = tracks
+
+        # Remove by position
+        playlist.remove_tracks(tracks=tracks, positions=[7, 2, 7])
+        self.request_mock.assert_called_once_with(
+            None,
+            request_type='DELETE',
+            endpoint=f'playlists/{playlist.spotify_id()}/tracks',
+            body={
+                'tracks': [
+                    {'uri': tracks[2].uri(), 'positions': [2]},
+                    {'uri': tracks[7].uri(), 'positions': [7]}
+                ]
+            }
+        )
+
+        # Positions take precedence over tracks
+        self.request_mock.reset_mock()
+        playlist.remove_tracks(tracks=[tracks[0]], positions=[7])
+        self.request_mock.assert_called_once_with(
+            None,
+            request_type='DELETE',
+            endpoint=f'playlists/{playlist.spotify_id()}/tracks',
+            body={'tracks': [{'uri': tracks[7].uri(), 'positions': [7]}]}
+        )
+
+        # Remove all occurrences of a track
+        self.request_mock.reset_mock()
+        playlist.remove_tracks(tracks=tracks[3])
+        self.request_mock.assert_called_once_with(
+            None,
+            request_type='DELETE',
+            endpoint=f'playlists/{playlist.spotify_id()}/tracks',
+            body={'tracks': [{'uri': tracks[3].uri()}]}
+        )
+
+        # Tracks must be in the playlist
+        other = get_dummy_data(const.TRACKS, limit=11, to_obj=True)[10]
+        self.assertRaises(ValueError, playlist.remove_tracks, tracks=other)
 
 
     @unittest.skip('Not yet implemented')
@@ -156,14 +288,61 @@ class TestPlaylist(unittest.TestCase):
         pass
 
 
-    @unittest.skip('Not yet implemented')
     def test_replace_all_tracks(self):
-        pass
+        self.request_mock.return_value = (None, 201)
+        playlist = get_dummy_data(const.PLAYLISTS, limit=1, to_obj=True)[0]
+        tracks = get_dummy_data(const.TRACKS, limit=205, to_obj=True)
+        uris = [track.uri() for track in tracks]
+        endpoint = f'playlists/{playlist.spotify_id()}/tracks'
+
+        # The first 100 tracks replace the playlist, the rest are appended
+        playlist.replace_all_tracks(tracks)
+        self.assertEqual(self.request_mock.call_args_list, [
+            call(None, request_type='PUT', endpoint=endpoint,
+                 body={'uris': uris[:100]}),
+            call(None, request_type='POST', endpoint=endpoint,
+                 body={'uris': uris[100:200]}),
+            call(None, request_type='POST', endpoint=endpoint,
+                 body={'uris': uris[200:]}),
+        ])
+
+        # Replacing with no tracks empties the playlist
+        self.request_mock.reset_mock()
+        playlist.replace_all_tracks([])
+        self.request_mock.assert_called_once_with(None,
+                                                  request_type='PUT',
+                                                  endpoint=endpoint,
+                                                  body={'uris': []})
 
 
-    @unittest.skip('Not yet implemented')
     def test_replace_image(self):
-        pass
+        self.request_mock.return_value = (None, 202)
+        playlist = get_dummy_data(const.PLAYLISTS, limit=1, to_obj=True)[0]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'cover.jpg')
+            with open(path, 'wb') as fp:
+                fp.write(b'\xff\xd8\xff' * 1000)
+
+            # The body is the base64 encoded image
+            playlist.replace_image(path)
+            self.request_mock.assert_called_once_with(
+                None,
+                request_type='PUT',
+                endpoint=f'playlists/{playlist.spotify_id()}/images',
+                body=base64.b64encode(b'\xff\xd8\xff' * 1000)
+            )
+
+            # Too large once encoded
+            with open(path, 'wb') as fp:
+                fp.write(b'\xff' * (const.MAX_IMAGE_SIZE // 4 * 3 + 1))
+            self.assertRaises(ValueError, playlist.replace_image, path)
+
+            # Not a JPEG
+            self.assertRaises(ValueError,
+                              playlist.replace_image,
+                              os.path.join(tmp_dir, 'cover.png'))
+        self.assertEqual(self.request_mock.call_count, 1)
 
 
 # This allows the tests to be executed
@@ -171,4 +350,5 @@ if __name__ == '__main__':
     unittest.main()
 
 #pylint: disable=wrong-import-position
+from spotifython.playlist import Playlist
 from spotifython.track import Track
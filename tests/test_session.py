@@ -9,6 +9,7 @@ Last updated: May 30, 2020
 # These 2 statements are fine to include in your test file
 #pylint: disable=missing-class-docstring
 #pylint: disable=missing-function-docstring
+#pylint: disable=protected-access
 
 # These are here so the template in particular passes pylint; don't copy them
 #pylint: disable=no-name-in-module
@@ -132,10 +133,29 @@ class TestArtist(unittest.TestCase):
     # Test reauthenticate
     def test_reauthenticate(self):
         session = Session(TOKEN)
+        self.assertEqual(session._http.headers['Authorization'],
+                         'Bearer ' + TOKEN)
         session.reauthenticate(TOKEN1)
         session_1 = Session(TOKEN1)
         self.assertFalse(session == session_1)
 
+        # Requests are sent with the new token
+        self.assertEqual(session._http.headers['Authorization'],
+                         'Bearer ' + TOKEN1)
+
+    def test_close(self):
+        session = Session(TOKEN)
+        with patch.object(session._http, 'close', autospec=True) as close:
+            session.close()
+            close.assert_called_once_with()
+
+            # Closed on exit, including when an exception is raised
+            with self.assertRaises(KeyError):
+                with session as entered:
+                    self.assertIs(entered, session)
+                    raise KeyError
+            self.assertEqual(close.call_count, 2)
+
     # Test token, timeout
     def test_getters(self):
         session = Session(TOKEN)
@@ -145,6 +165,22 @@ class TestArtist(unittest.TestCase):
         # Using default timeout
         self.assertEqual(session.timeout(), session.timeout())
         self.assertEqual(session.timeout(), session_1.timeout())
+        # Using default max_workers
+        self.assertEqual(session.max_workers(), const.DEFAULT_MAX_WORKERS)
+        self.assertEqual(Session(TOKEN, max_workers=3).max_workers(), 3)
+        self.assertRaises(TypeError, Session, TOKEN, max_workers='3')
+        self.assertRaises(ValueError, Session, TOKEN, max_workers=0)
+        self.assertRaises(TypeError, Session, TOKEN, rate_limit='10')
+        self.assertRaises(ValueError, Session, TOKEN, rate_limit=0)
+        self.assertRaises(TypeError, Session, TOKEN, cache_size=None)
+        self.assertRaises(ValueError, Session, TOKEN, cache_size=-1)
+
+        # The connection pool fits every concurrent request
+        # pylint: disable=protected-access
+        adapter = Session(TOKEN, max_workers=32)._http.get_adapter(
+            'https://api.spotify.com'
+        )
+        self.assertEqual(adapter._pool_maxsize, 32)
 
     # Test search
     def test_search(self):
@@ -270,6 +306,59 @@ class TestArtist(unittest.TestCase):
         self.assertEqual(search_result.playlists(), expected_playlists)
         self.assertEqual(search_result.tracks(), expected_tracks)
 
+    def test_search_pages(self):
+        session = Session(TOKEN, max_workers=4)
+        albums_json = get_dummy_data(const.ALBUMS, limit=30)
+        tracks_json = get_dummy_data(const.TRACKS, limit=120)
+
+        def search_response(session, request_type, endpoint, uri_params):
+            #pylint: disable=unused-argument
+            offset = uri_params['offset']
+            response_json = {}
+            for search_type in uri_params['type'].split(','):
+                items = albums_json if search_type == 'album' else tracks_json
+                response_json[search_type + 's'] = {
+                    'items': items[offset:offset + uri_params['limit']],
+                    'total': len(items),
+                }
+            return response_json, 200
+        self.request_mock.side_effect = search_response
+
+        search_result = session.search(query='dummy query',
+                                       types=[const.ALBUMS, const.TRACKS],
+                                       limit=None)
+        self.assertEqual(search_result.albums(),
+                         get_dummy_data(const.ALBUMS, limit=30, to_obj=True))
+        self.assertEqual(search_result.tracks(),
+                         get_dummy_data(const.TRACKS, limit=120, to_obj=True))
+
+        # After the first page, only types with more results are requested
+        pages = sorted(
+            (kwargs['uri_params']['offset'], kwargs['uri_params']['type'])
+            for _, kwargs in self.request_mock.call_args_list
+        )
+        self.assertEqual(pages, [(0, 'album,track'),
+                                 (50, 'track'),
+                                 (100, 'track')])
+
+        # Every page sends the query as given, for requests to encode
+        for _, kwargs in self.request_mock.call_args_list:
+            self.assertEqual(kwargs['uri_params']['q'], 'dummy query')
+
+        # Pages never ask for more than 50 results per type, or for more than
+        # the limit
+        self.request_mock.reset_mock()
+        search_result = session.search(query='dummy query',
+                                       types=const.TRACKS,
+                                       limit=60)
+        self.assertEqual(search_result.tracks(),
+                         get_dummy_data(const.TRACKS, limit=60, to_obj=True))
+        pages = sorted(
+            (kwargs['uri_params']['offset'], kwargs['uri_params']['limit'])
+            for _, kwargs in self.request_mock.call_args_list
+        )
+        self.assertEqual(pages, [(0, 50), (50, 10)])
+
     # Test get_albums
     def test_get_albums(self):
         session = Session(TOKEN)
@@ -312,6 +401,11 @@ class TestArtist(unittest.TestCase):
         )
         self.assertEqual(albums, expected_albums)
 
+        # Only a str or a list of str are accepted
+        self.assertRaises(TypeError, session.get_albums, 1234)
+        self.assertRaises(TypeError, session.get_albums, {'id': 'deadbeef'})
+        self.assertRaises(TypeError, session.get_albums, ['deadbeef', 1234])
+
     # Test get_artists
     def test_get_artists(self):
         session = Session(TOKEN)
@@ -376,6 +470,60 @@ class TestArtist(unittest.TestCase):
         )
         self.assertEqual(users, expected_users)
 
+    def test_get_single_id(self):
+        session = Session(TOKEN)
+
+        # A single id is sent as is, and its object is returned on its own
+        artist_json = expected_artists_json[0]
+        self.request_mock.return_value = ({'artists': [artist_json]}, 200)
+        artist = session.get_artists(artist_json['id'])
+        self.assertEqual(artist, expected_artists[0])
+        self.request_mock.assert_called_once_with(
+            session=session,
+            request_type=const.REQUEST_GET,
+            endpoint='artists',
+            uri_params={'ids': artist_json['id']}
+        )
+
+        self.request_mock.reset_mock()
+        self.request_mock.return_value = (expected_users_json[0], 200)
+        user = session.get_users(expected_users_json[0]['id'])
+        self.assertEqual(user, expected_users[0])
+        self.assertEqual(self.request_mock.call_args[1]['endpoint'],
+                         f'users/{expected_users_json[0]["id"]}')
+
+    def test_get_tracks_concurrent(self):
+        session = Session(TOKEN, max_workers=4)
+        tracks_by_id = {track['id']: track for track in expected_tracks_json}
+        self.request_mock.side_effect = \
+            lambda session, request_type, endpoint, uri_params: \
+                ({'tracks': [tracks_by_id[track_id]
+                             for track_id in uri_params['ids'].split(',')]},
+                 200)
+
+        # Batches of 50 come back in the order the tracks were asked for
+        track_ids = [track['id'] for track in expected_tracks_json] * 3
+        tracks = session.get_tracks(track_ids)
+        self.assertEqual(tracks, expected_tracks * 3)
+        self.assertEqual(self.request_mock.call_count,
+                         -(-len(track_ids) // 50))
+
+    def test_get_users_concurrent(self):
+        session = Session(TOKEN, max_workers=4)
+        users_by_endpoint = {
+            f'users/{user["id"]}': user for user in expected_users_json
+        }
+        self.request_mock.side_effect = \
+            lambda session, request_type, endpoint, uri_params: \
+                (users_by_endpoint[endpoint], 200)
+
+        # Users come back in the order they were asked for
+        users = session.get_users(
+            [user['id'] for user in expected_users_json]
+        )
+        self.assertEqual(users, expected_users)
+        self.assertEqual(self.request_mock.call_count, SEARCH_LIMIT_USERS)
+
     # Test current_user
     def test_current_user(self):
         session = Session(TOKEN)
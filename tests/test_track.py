@@ -2,6 +2,7 @@
 '''
 #pylint: disable=missing-class-docstring
 #pylint: disable=missing-function-docstring
+#pylint: disable=protected-access
 
 #TODO: remove this pylint ignore when the tests are written
 #pylint: disable=unused-import
@@ -14,6 +15,7 @@ from unittest.mock import patch
 from tests.help_lib import get_dummy_data
 import spotifython.constants as const
 import spotifython.utils as utils
+import spotifython.session as session_module
 from spotifython.session import Session
 
 TOKEN = 'feedbaed'
@@ -38,15 +40,28 @@ class TestTrack(unittest.TestCase):
         pass
 
 
-    @unittest.skip('Not yet implemented')
     def test_dunder(self):
         #str
         #repr
+        #len
+        tracks_json = get_dummy_data(const.TRACKS, limit=2)
+        track = Track(self.session, tracks_json[0])
+        same_track = Track(None, dict(tracks_json[0]))
+        other_track = Track(self.session, tracks_json[1])
+        album = Album(None, dict(tracks_json[0]['album'],
+                                 id=tracks_json[0]['id']))
+
         #eq
         #ne
+        self.assertEqual(track, same_track)
+        self.assertNotEqual(track, other_track)
+        self.assertNotEqual(track, album)
+        self.assertNotEqual(track, tracks_json[0]['id'])
+
         #hash
-        #len
-        pass
+        self.assertEqual(hash(track), hash(same_track))
+        self.assertEqual(hash(track), utils.spotifython_hash(track))
+        self.assertEqual(len({track, same_track, other_track}), 2)
 
 
     @unittest.skip('Not yet implemented')
@@ -59,14 +74,31 @@ class TestTrack(unittest.TestCase):
         pass
 
 
-    @unittest.skip('Not yet implemented')
     def test_album(self):
-        pass
+        track_json = get_dummy_data(const.TRACKS, limit=1)[0]
+        track = Track(self.session, track_json)
+        self.assertEqual(track.album(), Album(None, track_json['album']))
+        self.assertIs(track.album(), track.album())
+
+        # Tracks of a Session share their album
+        other_track = Track(self.session, dict(track_json, id='deadbeef'))
+        self.assertIs(other_track.album(), track.album())
+        other_session = Session(TOKEN)
+        other_track = Track(other_session, dict(track_json, id='deadbeef'))
+        self.assertIsNot(other_track.album(), track.album())
 
 
-    @unittest.skip('Not yet implemented')
     def test_artists(self):
-        pass
+        track_json = get_dummy_data(const.TRACKS, limit=1)[0]
+        track = Track(self.session, track_json)
+        expected = [Artist(None, artist) for artist in track_json['artists']]
+        self.assertEqual(track.artists(), expected)
+
+        # Tracks of a Session share their artists
+        other_track = Track(self.session, dict(track_json, id='deadbeef'))
+        for artist, other_artist in zip(track.artists(),
+                                        other_track.artists()):
+            self.assertIs(artist, other_artist)
 
 
     @unittest.skip('Not yet implemented')
@@ -109,14 +141,163 @@ class TestTrack(unittest.TestCase):
         pass
 
 
-    @unittest.skip('Not yet implemented')
+    def test_load_tracks(self):
+        # Simplified tracks, as in an album's tracks
+        tracks_json = get_dummy_data(const.TRACKS, limit=60)
+        tracks = [Track(self.session,
+                        {key: value for key, value in track_json.items()
+                         if key not in ['album', 'popularity']})
+                  for track_json in tracks_json]
+        full_track = Track(self.session, tracks_json[0])
+
+        self.request_mock.side_effect = [
+            ({'tracks': tracks_json[:50]}, 200),
+            ({'tracks': tracks_json[50:]}, 200),
+        ]
+        self.session.load_tracks(tracks + [full_track, tracks[0]])
+        self.assertEqual(self.request_mock.call_count, 2)
+        uri_params = self.request_mock.call_args_list[0][1]['uri_params']
+        self.assertEqual(uri_params['ids'].split(','),
+                         [track.spotify_id() for track in tracks[:50]])
+
+        # Loaded tracks don't fetch their fields one by one
+        self.assertEqual([track.popularity() for track in tracks],
+                         [track_json['popularity']
+                          for track_json in tracks_json])
+        self.assertEqual(self.request_mock.call_count, 2)
+
+        # Nothing left to load
+        self.session.load_tracks(tracks)
+        self.assertEqual(self.request_mock.call_count, 2)
+
+
     def test_audio_features(self):
-        pass
+        tracks_json = get_dummy_data(const.TRACKS, limit=150)
+        tracks = [Track(self.session, track_json)
+                  for track_json in tracks_json]
+        features = [{'id': track.spotify_id(), 'tempo': i}
+                    for i, track in enumerate(tracks)]
+
+        # Batches of 100, in order
+        self.request_mock.side_effect = [
+            ({'audio_features': features[:100]}, 200),
+            ({'audio_features': features[100:]}, 200),
+        ]
+        result = self.session.get_audio_features(tracks)
+        self.assertEqual(result, features)
+        self.assertEqual(self.request_mock.call_count, 2)
+        uri_params = self.request_mock.call_args_list[0][1]['uri_params']
+        self.assertEqual(uri_params['ids'].split(','),
+                         [track.spotify_id() for track in tracks[:100]])
+
+        # Features are only requested once per track id
+        duplicate = Track(self.session, tracks_json[3])
+        self.assertEqual(duplicate.audio_features(), features[3])
+        self.assertEqual(self.request_mock.call_count, 2)
+
+        # Modifying the result doesn't modify the cached features
+        duplicate.audio_features()['tempo'] = -1
+        self.assertEqual(duplicate.audio_features(), features[3])
+
+
+    def test_audio_features_missing(self):
+        track = Track(self.session, get_dummy_data(const.TRACKS, limit=1)[0])
+
+        # Spotify returns null for tracks without features, such as local tracks
+        self.request_mock.return_value = ({'audio_features': [None]}, 200)
+        self.assertRaises(utils.SpotifyError, track.audio_features)
+
+        # Missing features are not cached
+        features = {'id': track.spotify_id(), 'tempo': 1}
+        self.request_mock.return_value = ({'audio_features': [features]}, 200)
+        self.assertEqual(track.audio_features(), features)
+        self.assertEqual(self.request_mock.call_count, 2)
+
+
+    def test_audio_features_cache_size(self):
+        tracks_json = get_dummy_data(const.TRACKS, limit=3)
+        session = Session(TOKEN, cache_size=0)
+        tracks = [Track(session, track_json) for track_json in tracks_json]
+        features = [{'id': track.spotify_id()} for track in tracks]
+        self.request_mock.return_value = ({'audio_features': features}, 200)
+
+        # Nothing is cached with cache_size 0
+        session.get_audio_features(tracks)
+        session.get_audio_features(tracks)
+        self.assertEqual(self.request_mock.call_count, 2)
+
+        # Otherwise, the least recently used features are evicted
+        session = Session(TOKEN, cache_size=1)
+        session._audio_features_size = 2
+        tracks = [Track(session, track_json) for track_json in tracks_json]
+        session.get_audio_features(tracks)
+        self.assertEqual(list(session._audio_features),
+                         [track.spotify_id() for track in tracks[1:]])
+
+
+    @unittest.skipIf(session_module.np is None, 'numpy is not installed')
+    def test_audio_features_array(self):
+        tracks_json = get_dummy_data(const.TRACKS, limit=3)
+        tracks = [Track(self.session, track_json)
+                  for track_json in tracks_json]
+        features = [dict.fromkeys(const.AUDIO_FEATURE_KEYS, i)
+                    for i in range(2)]
+
+        # Spotify returns null for tracks it has no features for
+        self.request_mock.return_value = (
+            {'audio_features': features + [None]}, 200
+        )
+        ids, values = self.session.audio_features_array(tracks)
+        self.assertEqual(list(ids), [track.spotify_id() for track in tracks])
+        self.assertEqual(values.shape, (3, len(const.AUDIO_FEATURE_KEYS)))
+        self.assertEqual(values.dtype, session_module.np.float32)
+        self.assertTrue((values[0] == 0).all())
+        self.assertTrue((values[1] == 1).all())
+        self.assertTrue(session_module.np.isnan(values[2]).all())
+
+
+    def test_audio_features_array_no_numpy(self):
+        track = Track(self.session, get_dummy_data(const.TRACKS, limit=1)[0])
+        with patch.object(session_module, 'np', None):
+            self.assertRaises(ImportError,
+                              self.session.audio_features_array,
+                              track)
+        self.request_mock.assert_not_called()
+
+
+    def test_get_audio_analysis(self):
+        session = Session(TOKEN, max_workers=4)
+        tracks = [Track(session, track_json)
+                  for track_json in get_dummy_data(const.TRACKS, limit=10)]
+        self.request_mock.side_effect = \
+            lambda session, request_type, endpoint: \
+                ({'endpoint': endpoint}, 200)
+
+        # Analyses come back in the order of the tracks, and are kept by them
+        result = session.get_audio_analysis(tracks)
+        self.assertEqual(result,
+                         [{'endpoint': f'audio-analysis/{track.spotify_id()}'}
+                          for track in tracks])
+        self.assertEqual(tracks[3].audio_analysis(), result[3])
+        self.assertEqual(self.request_mock.call_count, 10)
 
 
-    @unittest.skip('Not yet implemented')
     def test_audio_analysis(self):
-        pass
+        track = get_dummy_data(const.TRACKS, limit=1, to_obj=True)[0]
+        analysis = {'track': {'tempo': 120.0}, 'bars': []}
+        self.request_mock.return_value = (analysis, 200)
+
+        # The analysis is only requested once
+        self.assertEqual(track.audio_analysis(), analysis)
+        self.assertEqual(track.audio_analysis(), analysis)
+        self.request_mock.assert_called_once_with(
+            session=track._session,
+            request_type=const.REQUEST_GET,
+            endpoint=f'audio-analysis/{track.spotify_id()}'
+        )
+
+        # The response, which the Session may have cached, isn't shared
+        self.assertIsNot(track.audio_analysis(), analysis)
 
 
 # This allows the tests to be executed
@@ -9,6 +9,7 @@ Last updated: May 14, 2020
 """
 #pylint: disable=missing-class-docstring
 #pylint: disable=missing-function-docstring
+#pylint: disable=protected-access
 
 # Standard library imports
 import random
@@ -16,7 +17,7 @@ import unittest
 from unittest.mock import patch
 
 # Local imports
-from tests.help_lib import get_dummy_data
+from tests.help_lib import get_dummy_data, paged_response
 import spotifython.constants as const
 import spotifython.utils as utils
 
@@ -28,10 +29,6 @@ class TestUser(unittest.TestCase):
 
 
     def setUp(self):
-        self.session = sp(TOKEN)
-        #TODO: fix when sp.get_users() is merged
-        self.user = User(self.session, {'id': USER_ID})
-
         # Mock the sp._request method so that we never actually reach Spotify
         self.patcher = patch.object(utils, 'request', autospec=True)
 
@@ -39,6 +36,10 @@ class TestUser(unittest.TestCase):
         self.addCleanup(self.patcher.stop)
         self.request_mock = self.patcher.start()
 
+        self.session = sp(TOKEN)
+        #TODO: fix when sp.get_users() is merged
+        self.user = User(self.session, {'id': USER_ID, 'display_name': 'me'})
+
 
     # Test that methods raise appropriate exns when given an unauthorized token.
     # TODO:
@@ -125,7 +126,6 @@ class TestUser(unittest.TestCase):
 
 
     # User.recently_played
-    @unittest.skip('User class udpated. have to update this test')
     def test_recently_played(self):
         user = self.user
 
@@ -135,13 +135,14 @@ class TestUser(unittest.TestCase):
 
         # Make sure you get at most 10 Tracks
         self.request_mock.return_value = (
-            {'items': get_dummy_data(const.TRACKS, 10)},
+            {'items': [{'played_at': '2016-12-13T20:44:04.589Z',
+                        'track': track}
+                       for track in get_dummy_data(const.TRACKS, 10)]},
             200
         )
         recently_played = user.recently_played(10)
-        self.assertLessEqual(len(recently_played), 10)
-        for elem in recently_played:
-            self.assertIsInstance(elem, Track)
+        self.assertEqual(recently_played,
+                         get_dummy_data(const.TRACKS, 10, True))
 
 
     # User.get_playlists
@@ -277,6 +278,113 @@ class TestUser(unittest.TestCase):
         print('%s follows %d artists. Does this look right?'
               % (user, len(artists)))
 
+    def test_get_following_artists(self):
+        artists_json = get_dummy_data(const.ARTISTS, 75)
+        self.request_mock.side_effect = [
+            ({'artists': {'items': artists_json[:50],
+                          'next': 'next_here',
+                          'cursors': {'after': 'cursor'},
+                          'limit': 50,
+                          'total': 75}},
+             200),
+            ({'artists': {'items': artists_json[50:],
+                          'next': None,
+                          'cursors': {'after': None},
+                          'limit': 50,
+                          'total': 75}},
+             200),
+        ]
+
+        artists = self.user.get_following(const.ARTISTS)
+        self.assertEqual(artists, get_dummy_data(const.ARTISTS, 75, True))
+
+        # The last page is known from the response, and pages use its cursor
+        self.assertEqual(self.request_mock.call_count, 2)
+        uri_params = self.request_mock.call_args_list[1][1]['uri_params']
+        self.assertEqual(uri_params['after'], 'cursor')
+
+        # Only as many artists as needed are requested
+        self.request_mock.side_effect = [
+            ({'artists': {'items': artists_json[:10],
+                          'next': 'next_here',
+                          'cursors': {'after': 'cursor'},
+                          'limit': 10,
+                          'total': 75}},
+             200),
+        ]
+        artists = self.user.get_following(const.ARTISTS, limit=10)
+        self.assertEqual(len(artists), 10)
+        uri_params = self.request_mock.call_args[1]['uri_params']
+        self.assertEqual(uri_params['limit'], 10)
+
+
+    def test_is_following_batches(self):
+        artists = get_dummy_data(const.ARTISTS, 60, True)
+        users = get_dummy_data(const.USERS, 10, True)
+
+        # Artist and user batches are sent together, in any order
+        followed_ids = {elem.spotify_id() for elem in (artists + users)[1::2]}
+        def contains(*_, **kwargs):
+            ids = kwargs['uri_params']['ids'].split(',')
+            return [elem_id in followed_ids for elem_id in ids], 200
+        self.request_mock.side_effect = contains
+
+        user = User(sp(TOKEN, max_workers=3),
+                    {'id': USER_ID, 'display_name': 'me'})
+        result = user.is_following(users + artists)
+        self.assertEqual(result,
+                         [(elem, elem.spotify_id() in followed_ids) \
+                          for elem in artists + users])
+
+        # 2 batches of at most 50 artists, 1 of users
+        self.assertEqual(self.request_mock.call_count, 3)
+        types = sorted(kwargs['uri_params']['type']
+                       for _, kwargs in self.request_mock.call_args_list)
+        self.assertEqual(types, ['artist', 'artist', 'user'])
+
+
+    def test_is_following_playlists(self):
+        playlists = get_dummy_data(const.PLAYLISTS, 4, True)
+        artist = get_dummy_data(const.ARTISTS, 1, True)[0]
+
+        # Followed playlists are only fetched when checking playlists
+        self.request_mock.return_value = ([True], 200)
+        with patch.object(User, 'get_following') as following_mock:
+            following_mock.return_value = playlists[1:3]
+            self.assertEqual(self.user.is_following(artist), [(artist, True)])
+            following_mock.assert_not_called()
+
+            result = self.user.is_following(playlists)
+            following_mock.assert_called_once_with(const.PLAYLISTS)
+        self.assertEqual(result, [(playlists[0], False),
+                                  (playlists[1], True),
+                                  (playlists[2], True),
+                                  (playlists[3], False)])
+
+
+    def test_has_saved_batches(self):
+        tracks = get_dummy_data(const.TRACKS, 120, True)
+        albums = get_dummy_data(const.ALBUMS, 30, True)
+
+        # Batches may be requested in any order, so answer based on the ids.
+        # The user has saved every other track and album.
+        saved_ids = {elem.spotify_id() for elem in (tracks + albums)[::2]}
+        def contains(*_, **kwargs):
+            ids = kwargs['uri_params']['ids'].split(',')
+            return [elem_id in saved_ids for elem_id in ids], 200
+        self.request_mock.side_effect = contains
+
+        user = User(sp(TOKEN, max_workers=3),
+                    {'id': USER_ID, 'display_name': 'me'})
+        result = user.has_saved(tracks + albums)
+        self.assertEqual(result,
+                         [(elem, elem.spotify_id() in saved_ids) \
+                          for elem in tracks + albums])
+
+        # 3 batches of at most 50 tracks, 2 of at most 20 albums
+        self.assertEqual(self.request_mock.call_count, 5)
+
+
     # User.has_saved
     @unittest.skip('User class udpated. have to update this test')
     def test_has_saved(self):
@@ -365,6 +473,76 @@ class TestUser(unittest.TestCase):
         self.assertEqual(73, len(user.get_saved(const.ALBUMS, limit=73)))
 
 
+    def test_get_saved_concurrent_pages(self):
+        total = 120
+        tracks_json = get_dummy_data(const.TRACKS, 50)
+        tracks_json = (tracks_json * 3)[:total]
+
+        self.request_mock.side_effect = paged_response(tracks_json,
+                                                       wrap_key='track')
+
+        user = User(sp(TOKEN, max_workers=3),
+                    {'id': USER_ID, 'display_name': 'me'})
+        tracks = user.get_saved(const.TRACKS)
+        self.assertEqual(tracks, [Track(None, track) for track in tracks_json])
+        self.assertEqual(self.request_mock.call_count, 3)
+
+
+    def test_follow_save_batches(self):
+        artists = get_dummy_data(const.ARTISTS, 60, True)
+        playlists = get_dummy_data(const.PLAYLISTS, 2, True)
+        tracks = get_dummy_data(const.TRACKS, 60, True)
+
+        # Batches may be sent in any order, so answer based on the endpoint
+        def modify(*_, **kwargs):
+            if kwargs['endpoint'] == Endpoints.USER_FOLLOW_ARTIST_USER:
+                return None, 204
+            return None, 200
+        self.request_mock.side_effect = modify
+
+        user = User(sp(TOKEN, max_workers=3),
+                    {'id': USER_ID, 'display_name': 'me'})
+        user.follow(artists + playlists)
+
+        # 2 batches of at most 50 artists, 1 request per playlist
+        self.assertEqual(self.request_mock.call_count, 4)
+        endpoints = sorted(kwargs['endpoint']
+                           for _, kwargs in self.request_mock.call_args_list)
+        self.assertEqual(
+            endpoints,
+            sorted([Endpoints.USER_FOLLOW_ARTIST_USER] * 2 +
+                   [Endpoints.USER_FOLLOW_PLAYLIST % playlist.spotify_id()
+                    for playlist in playlists])
+        )
+        followed_ids = [
+            artist_id
+            for _, kwargs in self.request_mock.call_args_list
+            if kwargs['uri_params'] is not None
+            for artist_id in kwargs['uri_params']['ids'].split(',')
+        ]
+        self.assertEqual(sorted(followed_ids),
+                         sorted(utils.map_ids(artists)))
+
+        # The user's playlists are fetched again after following playlists
+        with patch.object(utils, 'invalidate_cache') as invalidate_mock:
+            user.follow(artists)
+            invalidate_mock.assert_not_called()
+            user.unfollow(playlists[0])
+            invalidate_mock.assert_called_once_with(
+                user._session,
+                Endpoints.USER_PLAYLISTS % USER_ID
+            )
+
+        # 2 batches of at most 50 tracks
+        self.request_mock.reset_mock()
+        user.remove(tracks)
+        self.assertEqual(self.request_mock.call_count, 2)
+
+        # Any failed batch raises
+        self.request_mock.side_effect = [(None, 200), ({}, 400)]
+        self.assertRaises(utils.SpotifyError, user.remove, tracks)
+
+
     @unittest.skip('User class udpated. have to update this test')
     def test_follow(self):
         user = self.user
@@ -513,6 +691,7 @@ if __name__ == '__main__':
 #pylint: disable=wrong-import-order
 from spotifython.album import Album
 from spotifython.artist import Artist
+from spotifython.endpoints import Endpoints
 from spotifython.player import Player
 from spotifython.playlist import Playlist
 from spotifython.track import Track
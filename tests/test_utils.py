@@ -0,0 +1,409 @@
+'''Tests for the helpers in utils
+
+Note: these tests are not exhaustive and could always be improved. Instead of
+mocking utils.request, these tests replace the Session's HTTP session so that
+the request logic itself runs.
+'''
+#pylint: disable=missing-class-docstring
+#pylint: disable=missing-function-docstring
+#pylint: disable=protected-access
+
+# Standard library imports
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+# Third party imports
+import requests
+
+# Local imports
+import spotifython.constants as const
+import spotifython.utils as utils
+from spotifython.session import Session
+
+TOKEN = 'feebdaed'
+
+
+def make_response(status_code, content=None, headers=None):
+    """ Build a requests.Response as if it were sent by Spotify. """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b'' if content is None \
+        else json.dumps(content).encode('utf-8')
+    response.headers.update(headers or {})
+    return response
+
+
+class TestRequest(unittest.TestCase):
+
+
+    def setUp(self):
+        self.session = Session(TOKEN, cache_size=0)
+
+        # Answer requests without reaching Spotify
+        self.http_mock = Mock()
+        self.session._http = self.http_mock
+
+        # Never actually wait between retries
+        self.patcher = patch.object(utils.time, 'sleep')
+        self.addCleanup(self.patcher.stop)
+        self.sleep_mock = self.patcher.start()
+
+
+    def test_rate_limit_retry(self):
+        self.http_mock.request.side_effect = [
+            make_response(429, headers={'Retry-After': '3'}),
+            make_response(200, {'id': 'deadbeef'})
+        ]
+        result = utils.request(self.session, const.REQUEST_GET, 'me')
+        self.assertEqual(result, ({'id': 'deadbeef'}, 200))
+        self.sleep_mock.assert_called_once_with(3.0)
+
+
+    def test_rate_limit_give_up(self):
+        self.http_mock.request.return_value = make_response(
+            429,
+            {'error': {'status': 429, 'message': 'slow down'}},
+            headers={'Retry-After': '1'}
+        )
+        self.assertRaises(utils.NetworkError,
+                          utils.request,
+                          self.session,
+                          const.REQUEST_POST,
+                          'me/tracks')
+        self.assertEqual(self.http_mock.request.call_count,
+                         utils.MAX_RATE_LIMIT_RETRIES + 1)
+        self.assertEqual(self.sleep_mock.call_count,
+                         utils.MAX_RATE_LIMIT_RETRIES)
+
+
+    def test_body(self):
+        self.http_mock.request.return_value = make_response(201)
+
+        # Bodies are sent as json
+        utils.request(self.session,
+                      const.REQUEST_POST,
+                      'me/tracks',
+                      body={'ids': ['deadbeef']})
+        kwargs = self.http_mock.request.call_args[1]
+        self.assertEqual(json.loads(kwargs['data'].decode('utf-8')),
+                         {'ids': ['deadbeef']})
+        self.assertNotIn('Content-Type', kwargs['headers'])
+
+        # Except for images, which are sent as is
+        utils.request(self.session,
+                      const.REQUEST_PUT,
+                      'playlists/deadbeef/images',
+                      body=b'/9j/4AAQ')
+        kwargs = self.http_mock.request.call_args[1]
+        self.assertEqual(kwargs['data'], b'/9j/4AAQ')
+        self.assertEqual(kwargs['headers']['Content-Type'], 'image/jpeg')
+
+
+    def test_rate_limit_delay(self):
+        # Retry-After is used when present
+        response = make_response(429, headers={'Retry-After': '7'})
+        self.assertEqual(utils.rate_limit_delay(response, 0), 7.0)
+
+        # Otherwise, capped exponential backoff with jitter
+        for headers in [{}, {'Retry-After': 'soon'}]:
+            response = make_response(429, headers=headers)
+
+            delay = utils.rate_limit_delay(response, 0)
+            self.assertGreaterEqual(delay, utils.BACKOFF_BASE)
+            self.assertLessEqual(delay, 2 * utils.BACKOFF_BASE)
+
+            delay = utils.rate_limit_delay(response, 3)
+            self.assertGreaterEqual(delay, 8 * utils.BACKOFF_BASE)
+            self.assertLessEqual(delay, 9 * utils.BACKOFF_BASE)
+
+            delay = utils.rate_limit_delay(response, 50)
+            self.assertGreaterEqual(delay, utils.BACKOFF_CAP)
+            self.assertLessEqual(delay,
+                                 utils.BACKOFF_CAP + utils.BACKOFF_BASE)
+
+
+class TestResponseCache(unittest.TestCase):
+
+
+    def setUp(self):
+        self.session = Session(TOKEN, cache_size=2)
+
+        # Answer requests without reaching Spotify
+        self.http_mock = Mock()
+        self.session._http = self.http_mock
+
+
+    def test_max_age(self):
+        self.http_mock.request.return_value = make_response(
+            200,
+            {'id': 'deadbeef'},
+            headers={'Cache-Control': 'public, max-age=60'}
+        )
+        for _ in range(3):
+            result = utils.request(self.session, const.REQUEST_GET, 'me')
+            self.assertEqual(result, ({'id': 'deadbeef'}, 200))
+        self.assertEqual(self.http_mock.request.call_count, 1)
+
+        # Different params are a different response
+        utils.request(self.session,
+                      const.REQUEST_GET,
+                      'me',
+                      uri_params={'market': 'US'})
+        self.assertEqual(self.http_mock.request.call_count, 2)
+
+
+    def test_not_cached(self):
+        for headers in [{'Cache-Control': 'no-store, max-age=60'},
+                        {'Cache-Control': 'max-age=0'},
+                        {}]:
+            self.http_mock.reset_mock()
+            self.http_mock.request.return_value = make_response(
+                200,
+                {'id': 'deadbeef'},
+                headers=headers
+            )
+            utils.request(self.session, const.REQUEST_GET, 'me')
+            utils.request(self.session, const.REQUEST_GET, 'me')
+            self.assertEqual(self.http_mock.request.call_count, 2)
+
+
+    def test_revalidation(self):
+        self.http_mock.request.side_effect = [
+            make_response(200,
+                          {'id': 'deadbeef'},
+                          headers={'Cache-Control': 'max-age=0',
+                                   'ETag': '"v1"'}),
+            make_response(304),
+            make_response(200,
+                          {'id': 'feebdaed'},
+                          headers={'Cache-Control': 'max-age=0',
+                                   'ETag': '"v2"'}),
+        ]
+        utils.request(self.session, const.REQUEST_GET, 'me')
+
+        # A stale response is only sent again if it changed
+        result = utils.request(self.session, const.REQUEST_GET, 'me')
+        self.assertEqual(result, ({'id': 'deadbeef'}, 200))
+        headers = self.http_mock.request.call_args[1]['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+
+        # The 304 kept the validators of the cached response
+        result = utils.request(self.session, const.REQUEST_GET, 'me')
+        self.assertEqual(result, ({'id': 'feebdaed'}, 200))
+        headers = self.http_mock.request.call_args[1]['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+
+
+    def test_lru_eviction(self):
+        self.http_mock.request.return_value = make_response(
+            200,
+            {'id': 'deadbeef'},
+            headers={'Cache-Control': 'max-age=60'}
+        )
+        utils.request(self.session, const.REQUEST_GET, 'albums/1')
+        utils.request(self.session, const.REQUEST_GET, 'albums/2')
+        # Use albums/1, so albums/2 is the least recently used
+        utils.request(self.session, const.REQUEST_GET, 'albums/1')
+        utils.request(self.session, const.REQUEST_GET, 'albums/3')
+        self.assertEqual(self.http_mock.request.call_count, 3)
+
+        utils.request(self.session, const.REQUEST_GET, 'albums/1')
+        self.assertEqual(self.http_mock.request.call_count, 3)
+        utils.request(self.session, const.REQUEST_GET, 'albums/2')
+        self.assertEqual(self.http_mock.request.call_count, 4)
+
+
+    def test_write_invalidates(self):
+        self.http_mock.request.side_effect = [
+            make_response(200,
+                          {'name': 'old'},
+                          headers={'Cache-Control': 'max-age=60'}),
+            make_response(200),
+            make_response(200,
+                          {'name': 'new'},
+                          headers={'Cache-Control': 'max-age=60'}),
+        ]
+        endpoint = 'playlists/deadbeef'
+        utils.request(self.session, const.REQUEST_GET, endpoint)
+        utils.request(self.session,
+                      const.REQUEST_PUT,
+                      endpoint,
+                      body={'name': 'new'})
+        result = utils.request(self.session, const.REQUEST_GET, endpoint)
+        self.assertEqual(result, ({'name': 'new'}, 200))
+
+        # Writes also invalidate the endpoints under the modified one, but not
+        # endpoints that only share a prefix
+        cache = utils.ResponseCache(10)
+        for cached in ['playlists/a', 'playlists/a/tracks', 'playlists/ab']:
+            cache.put(cache.key(cached, None),
+                      {},
+                      {'Cache-Control': 'max-age=60'})
+        cache.invalidate('playlists/a')
+        self.assertIsNone(cache.lookup(cache.key('playlists/a', None)))
+        self.assertIsNone(cache.lookup(cache.key('playlists/a/tracks', None)))
+        self.assertIsNotNone(cache.lookup(cache.key('playlists/ab', None)))
+
+        # And the endpoints above it, whose responses include it
+        for cached in ['playlists/a', 'playlists/a/tracks', 'playlists/ab']:
+            cache.put(cache.key(cached, None),
+                      {},
+                      {'Cache-Control': 'max-age=60'})
+        cache.invalidate('playlists/a/tracks')
+        self.assertIsNone(cache.lookup(cache.key('playlists/a', None)))
+        self.assertIsNone(cache.lookup(cache.key('playlists/a/tracks', None)))
+        self.assertIsNotNone(cache.lookup(cache.key('playlists/ab', None)))
+
+
+class TestRateLimiter(unittest.TestCase):
+
+
+    def setUp(self):
+        # Control the clock, and never actually wait for a token
+        self.now = 0
+        monotonic_patcher = patch.object(utils.time,
+                                         'monotonic',
+                                         side_effect=lambda: self.now)
+        sleep_patcher = patch.object(utils.time, 'sleep')
+        self.addCleanup(monotonic_patcher.stop)
+        self.addCleanup(sleep_patcher.stop)
+        monotonic_patcher.start()
+        self.sleep_mock = sleep_patcher.start()
+
+
+    def test_burst(self):
+        limiter = utils.RateLimiter(2)
+
+        # A full bucket lets a burst through
+        limiter.acquire()
+        limiter.acquire()
+        self.sleep_mock.assert_not_called()
+
+        # Once empty, requests are spaced out at the rate
+        limiter.acquire()
+        self.sleep_mock.assert_called_with(0.5)
+        limiter.acquire()
+        self.sleep_mock.assert_called_with(1.0)
+
+
+    def test_refill(self):
+        limiter = utils.RateLimiter(2)
+        for _ in range(3):
+            limiter.acquire()
+        self.assertEqual(self.sleep_mock.call_count, 1)
+
+        # The bucket refills over time, up to its capacity
+        self.now = 10
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(self.sleep_mock.call_count, 1)
+        limiter.acquire()
+        self.assertEqual(self.sleep_mock.call_count, 2)
+
+
+    def test_pause(self):
+        limiter = utils.RateLimiter(2)
+        limiter.pause(5)
+
+        # Requests wait out the pause, then go one at a time at the rate
+        limiter.acquire()
+        self.sleep_mock.assert_called_with(5)
+        limiter.acquire()
+        self.sleep_mock.assert_called_with(5.5)
+
+        # The bucket refills from the end of the pause
+        self.now = 6
+        limiter.acquire()
+        self.assertEqual(self.sleep_mock.call_count, 2)
+
+
+    def test_retry_pauses_limiter(self):
+        session = Session(TOKEN, rate_limit=2, cache_size=0)
+        session._http = Mock()
+        session._http.request.side_effect = [
+            make_response(429, headers={'Retry-After': '3'}),
+            make_response(200, {'id': 'deadbeef'})
+        ]
+
+        # The retry waits for the Retry-After through the limiter
+        result = utils.request(session, const.REQUEST_GET, 'me')
+        self.assertEqual(result, ({'id': 'deadbeef'}, 200))
+        self.sleep_mock.assert_called_once_with(3)
+
+
+class TestBatches(unittest.TestCase):
+
+
+    def test_create_batches(self):
+        batches = utils.create_batches([1, 2, 3, 4, 5, 6, 7], batch_size=2)
+        self.assertEqual(list(batches), [[1, 2], [3, 4], [5, 6], [7]])
+        self.assertEqual(list(utils.create_batches([], batch_size=2)), [])
+
+
+class TestSeparate(unittest.TestCase):
+
+
+    def test_separate(self):
+        ints, strs = utils.separate([1, 'a', 2, 'b', 3], [int, str])
+        self.assertEqual(ints, [1, 2, 3])
+        self.assertEqual(strs, ['a', 'b'])
+        self.assertEqual(utils.separate([], [int, str]), [[], []])
+
+        # Instances of subclasses go to their first matching type
+        self.assertEqual(utils.separate([True, 1, 'a'], [str, int]),
+                         [['a'], [True, 1]])
+        self.assertRaises(TypeError, utils.separate, [1, 2.0], [int, str])
+
+
+class TestInternMarkets(unittest.TestCase):
+
+
+    def test_intern_markets(self):
+        # Separately parsed objects have separate strings
+        raws = [json.loads('{"available_markets": ["US", "FR"]}')
+                for _ in range(2)]
+        self.assertIsNot(raws[0]['available_markets'][0],
+                         raws[1]['available_markets'][0])
+
+        for raw in raws:
+            utils.intern_markets(raw)
+        self.assertEqual(raws[0]['available_markets'], ['US', 'FR'])
+        self.assertIs(raws[0]['available_markets'][0],
+                      raws[1]['available_markets'][0])
+
+        # Objects without markets are left alone
+        raw = {'id': 'deadbeef'}
+        utils.intern_markets(raw)
+        self.assertEqual(raw, {'id': 'deadbeef'})
+
+
+class TestJson(unittest.TestCase):
+
+
+    def check_round_trip(self):
+        obj = {'uris': ['spotify:track:deadbeef'], 'position': 0, 'name': 'é'}
+        data = utils.json_dumps(obj)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(json.loads(data.decode('utf-8')), obj)
+        self.assertEqual(utils.json_loads(data), obj)
+        self.assertEqual(utils.json_loads(data.decode('utf-8')), obj)
+
+        # Empty and invalid content raise ValueError, as request() expects
+        self.assertRaises(ValueError, utils.json_loads, b'')
+        self.assertRaises(ValueError, utils.json_loads, b'<html>')
+
+
+    def test_stdlib_fallback(self):
+        with patch.object(utils, 'orjson', None):
+            self.check_round_trip()
+
+
+    @unittest.skipIf(utils.orjson is None, 'orjson is not installed')
+    def test_orjson(self):
+        self.check_round_trip()
+
+
+# This allows the tests to be executed
+if __name__ == '__main__':
+    unittest.main()